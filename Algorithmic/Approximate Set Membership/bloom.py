@@ -9,13 +9,85 @@ import math
 import random
 import string
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import mmh3
 import numpy as np
 
 
+class BitArray:
+    """A fixed-size array of bits packed eight to a byte.
+
+    Bit ``i`` lives in byte ``i // 8`` at bit offset ``i % 8`` (little-endian
+    bit order), so the packed bytes can be counted and updated with native
+    integer and NumPy operations instead of per-bit Python loops.
+
+    Attributes:
+        size (int): The number of bits in the array.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Create a bit array with every bit cleared.
+
+        Args:
+            size: The number of bits to allocate.
+        """
+        self.size = size
+        self._bytes = bytearray((size + 7) // 8)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """Return a single bit, or a slice of bits as a NumPy array."""
+        if isinstance(key, slice):
+            return self.to_numpy()[key]
+        return self.get(key)
+
+    def get(self, position: int) -> int:
+        """Return the bit at ``position`` (0 or 1)."""
+        return (self._bytes[position >> 3] >> (position & 7)) & 1
+
+    def set(self, position: int) -> None:
+        """Set the bit at ``position`` to 1."""
+        self._bytes[position >> 3] |= 1 << (position & 7)
+
+    def set_many(self, positions: Iterable[int]) -> None:
+        """Set every bit in ``positions`` to 1 with one vectorized update.
+
+        Args:
+            positions: Bit indices; repeated indices are allowed.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        packed = np.frombuffer(self._bytes, dtype=np.uint8)
+        masks = np.left_shift(1, positions & 7).astype(np.uint8)
+        np.bitwise_or.at(packed, positions >> 3, masks)
+
+    def get_many(self, positions: Iterable[int]) -> np.ndarray:
+        """Return the bits at ``positions`` as a boolean array."""
+        positions = np.asarray(positions, dtype=np.int64)
+        packed = np.frombuffer(self._bytes, dtype=np.uint8)
+        return (packed[positions >> 3] >> (positions & 7)) & 1 == 1
+
+    def count(self) -> int:
+        """Return the number of bits set to 1."""
+        return int.from_bytes(self._bytes, "little").bit_count()
+
+    def density(self) -> float:
+        """Return the fraction of bits set to 1."""
+        return self.count() / self.size
+
+    def clear(self) -> None:
+        """Reset every bit to 0."""
+        self._bytes[:] = bytes(len(self._bytes))
+
+    def to_numpy(self) -> np.ndarray:
+        """Return the bits unpacked into a ``uint8`` array of 0s and 1s."""
+        packed = np.frombuffer(self._bytes, dtype=np.uint8)
+        return np.unpackbits(packed, count=self.size, bitorder="little")
+
+
 class BloomFilter:
     """A space-efficient probabilistic data structure for set membership.
 
@@ -28,9 +100,9 @@ class BloomFilter:
         false_positive_rate (float): The desired maximum false positive probability.
         size (int): The size of the bit array (m).
         hash_count (int): The number of hash functions to use (k).
-        bit_array (List[int]): The bit array storing the set membership info.
+        bit_array (BitArray): The bit array storing the set membership info.
         element_count (int): The number of elements currently added.
-        hash_seeds (List[int]): Random seeds for the hash functions.
+        hash_seed (int): Random seed for the base hash function.
     """
 
     def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
@@ -49,11 +121,13 @@ class BloomFilter:
         self.hash_count = self._optimal_hash_count(self.size, capacity)
 
         # Initialize bit array
-        self.bit_array = [0] * self.size
+        self.bit_array = BitArray(self.size)
         self.element_count = 0
 
-        # Generate unique seeds for hash functions to ensure independence
-        self.hash_seeds = [random.randint(0, 2**32 - 1) for _ in range(self.hash_count)]
+        # One 128-bit MurmurHash per item yields both double-hashing halves
+        self.hash_seed = random.randint(0, 2**32 - 1)
+        self._offsets = range(self.hash_count)
+        self._offset_array = np.arange(self.hash_count, dtype=np.int64)
 
         print("Bloom Filter initialized:")
         print(f"  Capacity: {capacity} elements")
@@ -90,7 +164,9 @@ class BloomFilter:
     def _get_hash_positions(self, item: Any) -> List[int]:
         """Generate hash positions for an item.
 
-        Uses MurmurHash3 with different seeds to simulate multiple hash functions.
+        Uses Kirsch-Mitzenmacher double hashing: the two 64-bit halves of one
+        MurmurHash3 call, ``h1`` and ``h2``, give the i-th position as
+        ``(h1 + i * h2) mod m``, which behaves like k independent hashes.
 
         Args:
             item: The item to be hashed.
@@ -98,14 +174,28 @@ class BloomFilter:
         Returns:
             List[int]: A list of bit array indices.
         """
-        positions = []
-        item_str = str(item)
-        for seed in self.hash_seeds:
-            # Hash the item and map to bit array position
-            hash_val = mmh3.hash(item_str, seed)
-            position = hash_val % self.size
-            positions.append(abs(position))  # Ensure positive position
-        return positions
+        h1, h2 = self._hash_pair(item)
+        return [(h1 + i * h2) % self.size for i in self._offsets]
+
+    def _hash_pair(self, item: Any) -> Tuple[int, int]:
+        """Return both double-hashing halves for an item, reduced modulo m."""
+        h1, h2 = mmh3.hash64(str(item), self.hash_seed, signed=False)
+        # A zero step would map every hash function to the same bit.
+        return h1 % self.size, h2 % self.size or 1
+
+    def _get_hash_positions_many(self, items: Iterable[Any]) -> np.ndarray:
+        """Generate hash positions for many items at once.
+
+        Args:
+            items: The items to be hashed.
+
+        Returns:
+            np.ndarray: An ``(len(items), hash_count)`` array of bit indices,
+            row ``j`` matching ``_get_hash_positions(items[j])``.
+        """
+        pairs = np.array([self._hash_pair(item) for item in items], dtype=np.int64)
+        pairs = pairs.reshape(-1, 2)
+        return (pairs[:, :1] + self._offset_array * pairs[:, 1:]) % self.size
 
     def add(self, item: Any) -> None:
         """Add an element to the Bloom Filter.
@@ -115,9 +205,32 @@ class BloomFilter:
         """
         positions = self._get_hash_positions(item)
         for pos in positions:
-            self.bit_array[pos] = 1
+            self.bit_array.set(pos)
         self.element_count += 1
 
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Add several elements with a single vectorized bit update.
+
+        Args:
+            items: The items to add.
+        """
+        positions = self._get_hash_positions_many(items)
+        self.bit_array.set_many(positions.ravel())
+        self.element_count += len(positions)
+
+    def contains_many(self, items: Iterable[Any]) -> np.ndarray:
+        """Check several elements at once.
+
+        Args:
+            items: The items to check.
+
+        Returns:
+            np.ndarray: One boolean per item, with the same meaning as
+            :meth:`contains`.
+        """
+        positions = self._get_hash_positions_many(items)
+        return self.bit_array.get_many(positions).all(axis=1)
+
     def contains(self, item: Any) -> bool:
         """Check if an element is present in the Bloom Filter.
 
@@ -129,7 +242,7 @@ class BloomFilter:
                   False if the item is definitely not present.
         """
         positions = self._get_hash_positions(item)
-        return all(self.bit_array[pos] == 1 for pos in positions)
+        return all(self.bit_array.get(pos) for pos in positions)
 
     def actual_false_positive_rate(self) -> float:
         """Calculate the theoretical false positive rate based on current load.
@@ -150,12 +263,11 @@ class BloomFilter:
         Returns:
             float: The fraction of bits that are set to 1.
         """
-        set_bits = sum(self.bit_array)
-        return set_bits / self.size
+        return self.bit_array.density()
 
     def reset(self) -> None:
         """Reset the Bloom Filter to an empty state."""
-        self.bit_array = [0] * self.size
+        self.bit_array.clear()
         self.element_count = 0
 
 
@@ -200,14 +312,16 @@ class BloomFilterAnalyzer:
             float: The calculated false positive rate.
         """
         # Add inserted items to bloom filter
-        for item in inserted_items:
-            bloom_filter.add(item)
+        bloom_filter.add_many(inserted_items)
 
         # Test with items that were definitely not inserted
-        false_positives = 0
-        for test_item in test_items:
-            if test_item not in inserted_items and bloom_filter.contains(test_item):
-                false_positives += 1
+        inserted = set(inserted_items)
+        maybe_present = bloom_filter.contains_many(test_items)
+        false_positives = sum(
+            1
+            for test_item, hit in zip(test_items, maybe_present)
+            if hit and test_item not in inserted
+        )
 
         actual_fpr = false_positives / len(test_items)
         return actual_fpr
@@ -408,20 +522,17 @@ class AdvancedBloomFilterTests:
 
         # Add elements
         print("Adding elements to Bloom Filter...")
-        for i, item in enumerate(test_data):
-            bf_large.add(item)
-            if i % 100000 == 0 and i > 0:
-                print(f"  Added {i} elements...")
+        batch_size = 100000
+        for start in range(0, large_capacity, batch_size):
+            bf_large.add_many(test_data[start : start + batch_size])
+            if start > 0:
+                print(f"  Added {start} elements...")
 
         # Test false positives
         print("Testing false positive rate...")
-        false_positives = 0
         test_size = 10000
         negative_test_data = [f"negative_{i}" for i in range(test_size)]
-
-        for item in negative_test_data:
-            if bf_large.contains(item):
-                false_positives += 1
+        false_positives = int(bf_large.contains_many(negative_test_data).sum())
 
         actual_fpr = false_positives / test_size
         print(f"Results for {large_capacity:,} elements:")
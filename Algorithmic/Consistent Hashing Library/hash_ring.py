@@ -9,7 +9,7 @@ from __future__ import annotations
 import hashlib
 from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List, Optional, Protocol, Sequence
+from typing import List, Optional, Protocol, Sequence, Set
 
 
 class HashFunction(Protocol):
@@ -22,7 +22,11 @@ class HashFunction(Protocol):
 
 
 class Sha256Hash:
-    """Default hash function using SHA-256."""
+    """Default hash function using SHA-256.
+
+    Ring positions use the first 64 bits of the digest, which is plenty to
+    spread buckets evenly and keeps the position integers small.
+    """
 
     def __call__(self, value: str) -> int:
         """Compute SHA-256 hash of a string.
@@ -34,7 +38,28 @@ class Sha256Hash:
             int: The integer hash value.
         """
         digest = hashlib.sha256(value.encode("utf-8")).digest()
-        return int.from_bytes(digest, "big", signed=False)
+        return int.from_bytes(digest[:8], "big", signed=False)
+
+    def hash_vnodes(self, node: str, vnode_count: int) -> List[int]:
+        """Hash ``"{node}#{vnode}"`` for every virtual node of ``node``.
+
+        Same results as calling the instance on each string, but the shared
+        ``"{node}#"`` prefix is hashed once and the state copied per vnode.
+
+        Args:
+            node: The node identifier.
+            vnode_count: Number of virtual nodes.
+
+        Returns:
+            List[int]: One hash per virtual node, in vnode order.
+        """
+        prefix = hashlib.sha256(f"{node}#".encode("utf-8"))
+        hashes = []
+        for vnode in range(vnode_count):
+            state = prefix.copy()
+            state.update(b"%d" % vnode)
+            hashes.append(int.from_bytes(state.digest()[:8], "big", signed=False))
+        return hashes
 
 
 @dataclass(order=True)
@@ -58,6 +83,9 @@ class HashRing:
     Each bucket stores ``(hash, node, vnode)`` where ``vnode`` is the
     virtual-node index for the physical node. The ring is kept sorted by hash
     to support efficient lookups with ``bisect``.
+
+    Buckets are held as three parallel lists rather than one object per
+    virtual node; :attr:`buckets` builds :class:`Bucket` views on demand.
     """
 
     def __init__(self, hash_function: Optional[HashFunction] = None) -> None:
@@ -67,18 +95,21 @@ class HashRing:
             hash_function: Custom hash function. Defaults to SHA-256.
         """
         self.hash_function = hash_function or Sha256Hash()
-        self._buckets: List[Bucket] = []
         self._hashes: List[int] = []
+        self._nodes: List[str] = []
+        self._vnodes: List[int] = []
 
     @property
     def buckets(self) -> Sequence[Bucket]:
         """Get the current list of buckets (read-only view)."""
-        return tuple(self._buckets)
+        return tuple(map(Bucket, self._hashes, self._nodes, self._vnodes))
 
     def _rebuild_index(self) -> None:
-        """Re-sort buckets and rebuild the hash index."""
-        self._buckets.sort(key=lambda bucket: bucket.hash)
-        self._hashes = [bucket.hash for bucket in self._buckets]
+        """Re-sort the parallel bucket lists by hash."""
+        order = sorted(range(len(self._hashes)), key=self._hashes.__getitem__)
+        self._hashes = [self._hashes[i] for i in order]
+        self._nodes = [self._nodes[i] for i in order]
+        self._vnodes = [self._vnodes[i] for i in order]
 
     def add_node(self, node: str, vnode_count: int = 100) -> None:
         """Add a physical node with virtual nodes.
@@ -88,9 +119,15 @@ class HashRing:
             vnode_count: Number of virtual nodes to distribute on the ring.
                          Higher counts improve load balancing.
         """
-        for vnode in range(vnode_count):
-            bucket_hash = self.hash_function(f"{node}#{vnode}")
-            self._buckets.append(Bucket(bucket_hash, node, vnode))
+        hash_function = self.hash_function
+        if isinstance(hash_function, Sha256Hash):
+            self._hashes.extend(hash_function.hash_vnodes(node, vnode_count))
+        else:
+            self._hashes.extend(
+                hash_function(f"{node}#{vnode}") for vnode in range(vnode_count)
+            )
+        self._nodes.extend([node] * vnode_count)
+        self._vnodes.extend(range(vnode_count))
         self._rebuild_index()
 
     def remove_node(self, node: str) -> None:
@@ -99,8 +136,11 @@ class HashRing:
         Args:
             node: The node identifier to remove.
         """
-        self._buckets = [bucket for bucket in self._buckets if bucket.node != node]
-        self._rebuild_index()
+        # Filtering keeps the remaining buckets in hash order.
+        keep = [i for i, owner in enumerate(self._nodes) if owner != node]
+        self._hashes = [self._hashes[i] for i in keep]
+        self._nodes = [self._nodes[i] for i in keep]
+        self._vnodes = [self._vnodes[i] for i in keep]
 
     def lookup(self, key: str, replicas: int = 1) -> List[str]:
         """Return the primary node followed by replica nodes for ``key``.
@@ -117,7 +157,7 @@ class HashRing:
         """
         if replicas < 1:
             raise ValueError("replicas must be at least 1")
-        if not self._buckets:
+        if not self._hashes:
             raise ValueError("hash ring is empty")
 
         key_hash = self.hash_function(key)
@@ -125,14 +165,18 @@ class HashRing:
         start = bisect_right(self._hashes, key_hash)
 
         result: List[str] = []
-        visited = 0
-        total = len(self._buckets)
-
-        # Walk around the ring to find unique physical nodes
-        while len(result) < replicas and visited < total:
-            bucket = self._buckets[(start + visited) % total]
-            if bucket.node not in result:
-                result.append(bucket.node)
-            visited += 1
+        seen: Set[str] = set()
+        nodes = self._nodes
+        total = len(nodes)
+
+        # Walk around the ring to find unique physical nodes, stopping as
+        # soon as enough have been found
+        for visited in range(total):
+            node = nodes[(start + visited) % total]
+            if node not in seen:
+                seen.add(node)
+                result.append(node)
+                if len(result) == replicas:
+                    break
 
         return result
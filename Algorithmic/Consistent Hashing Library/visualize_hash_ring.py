@@ -38,8 +38,8 @@ class ConsistentHashingDemo(Scene):
         # Helper to map hash to angle
         def hash_to_angle(h: int) -> float:
             """Map hash space to 0-2PI radians."""
-            # SHA-256 max hash
-            max_hash = 2**256
+            # Sha256Hash keeps the first 64 bits of the digest
+            max_hash = 2**64
             # Normalize to [0, 1] then scale to [0, 2PI]
             # Note: Manim circles start at 0 degrees (Right) and go counter-clockwise.
             # Consistent hashing typically goes clockwise, but visual mapping holds.
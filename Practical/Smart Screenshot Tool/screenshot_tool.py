@@ -7,24 +7,73 @@ OCR text to enable search.
 
 from __future__ import annotations
 
+import functools
+import os
+import queue
 import sqlite3
+import tempfile
 import threading
 import time
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from tkinter import colorchooser, filedialog, messagebox, simpledialog
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
-import mss
-import pytesseract
-from PIL import Image, ImageDraw, ImageTk
+# OCR batches run in parallel on a worker pool, so keep each tesseract engine
+# single-threaded instead of letting OpenMP threads fight over the same cores.
+# This must be set before tesserocr loads its OpenMP runtime.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+import mss  # noqa: E402
+import pytesseract  # noqa: E402
+from PIL import Image, ImageDraw, ImageTk  # noqa: E402
+
+try:
+    import tesserocr  # noqa: E402
+except ImportError:  # pragma: no cover - optional fast path
+    tesserocr = None
+
+try:
+    import cv2  # noqa: E402
+except ImportError:  # pragma: no cover - optional preprocessing
+    cv2 = None
+
+try:
+    import pyvips  # noqa: E402
+except (ImportError, OSError):  # pragma: no cover - optional fast path
+    pyvips = None
 
 APP_NAME = "Smart Screenshot Tool"
 DEFAULT_COLOR = "#ff0000"
 DB_NAME = "index.db"
 SCREENSHOT_DIR = "screenshots"
 SUPPORTED_TOOLS = ("pen", "rectangle", "ellipse", "text")
+# zlib level 1 encodes screenshots several times faster than Pillow's default
+# of 6 for a negligible size difference. JPEG saves ignore the option.
+PNG_COMPRESS_LEVEL = 1
+THUMBNAIL_SIZE = 320
+THUMB_CACHE_SIZE = 128
+THUMB_SUFFIX = ".thumb.jpg"
+VIPS_BAND_MODES = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}
+UI_POLL_MS = 100
+SEARCH_DEBOUNCE_MS = 150
+SEARCH_CACHE_SIZE = 64
+OCR_BATCH_SIZE = 16
+OCR_BATCH_WAIT = 0.25  # seconds to wait for more captures before running a batch
+# Page segmentation mode 6 treats a capture as one uniform block of text,
+# which skips the full layout analysis of the default mode 3.
+TESSERACT_CONFIG = "--psm 6"
+OCR_MIN_CONFIDENCE = 40  # words below this tesseract confidence are not indexed
+OCR_MAX_WORKERS = min(4, os.cpu_count() or 1)
+# Tesseract's cost grows with pixel count; larger captures are downscaled to
+# fit this bounding box before OCR (the saved file itself is left untouched).
+OCR_MAX_DIMENSION = 2000
+# Adaptive threshold parameters used to binarise captures before OCR.
+THRESHOLD_BLOCK_SIZE = 31
+THRESHOLD_OFFSET = 10
 
 
 class IndexStore:
@@ -33,11 +82,25 @@ class IndexStore:
     def __init__(self, base_path: Path):
         self.base_path = base_path
         self.db_path = base_path / DB_NAME
+        # Bumped on every write so cached search results never go stale. OCR
+        # pool threads index concurrently, so the bump happens under a lock.
+        self.version = 0
+        self._version_lock = threading.Lock()
+        self._cached_search = functools.lru_cache(maxsize=SEARCH_CACHE_SIZE)(
+            self._search
+        )
         self._ensure_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        # With WAL, NORMAL only syncs at checkpoints instead of every commit.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _ensure_database(self) -> None:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS screenshots (
                     id INTEGER PRIMARY KEY,
@@ -49,17 +112,27 @@ class IndexStore:
             conn.commit()
 
     def index_image(self, image_path: Path, ocr_text: str) -> None:
+        self.index_bulk([(image_path, ocr_text)])
+
+    def index_bulk(self, entries: List[Tuple[Path, str]]) -> None:
+        """Index several images in a single transaction (one commit)."""
         created_at = datetime.utcnow().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._connect() as conn:
+            conn.executemany(
                 "INSERT OR REPLACE INTO screenshots(path, created_at, ocr_text) VALUES(?, ?, ?)",
-                (str(image_path), created_at, ocr_text),
+                [(str(path), created_at, text) for path, text in entries],
             )
             conn.commit()
+        with self._version_lock:
+            self.version += 1
 
     def search(self, query: str) -> List[Tuple[str, str]]:
+        return list(self._cached_search(query, self.version))
+
+    def _search(self, query: str, version: int) -> Tuple[Tuple[str, str], ...]:
+        # ``version`` is unused here; it only makes the LRU key change on writes.
         like_query = f"%{query}%"
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """
                 SELECT path, created_at
@@ -69,7 +142,7 @@ class IndexStore:
                 """,
                 (like_query, like_query),
             ).fetchall()
-        return [(path, created_at) for path, created_at in rows]
+        return tuple((path, created_at) for path, created_at in rows)
 
     def all(self) -> List[Tuple[str, str]]:
         return self.search("")
@@ -84,6 +157,20 @@ class SmartScreenshotApp(tk.Tk):
         self.screenshot_dir = base_path / SCREENSHOT_DIR
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
         self.index = IndexStore(base_path)
+        self._ocr_queue: "queue.Queue[Path]" = queue.Queue()
+        # Saves are encoded by a writer thread which then feeds the OCR queue.
+        self._io_queue: "queue.Queue[Tuple[Image.Image, Path]]" = queue.Queue()
+        # Tk is not thread-safe: worker threads post callbacks here and the
+        # main loop runs them from ``_drain_ui_queue``.
+        self._ui_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        # A persistent tesserocr handle loads the language data once; it is not
+        # thread-safe, so every use goes through ``_tess_lock``.
+        self._tess = self._open_tesseract_api()
+        self._tess_lock = threading.Lock()
+        self._ocr_pool = ThreadPoolExecutor(max_workers=OCR_MAX_WORKERS)
+        threading.Thread(target=self._writer_worker, daemon=True).start()
+        threading.Thread(target=self._ocr_worker, daemon=True).start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.current_image: Optional[Image.Image] = None
         self.current_photo: Optional[ImageTk.PhotoImage] = None
@@ -93,8 +180,53 @@ class SmartScreenshotApp(tk.Tk):
         self.preview_shape = None
         self.start_x: Optional[int] = None
         self.start_y: Optional[int] = None
+        self._gallery_key: Optional[Tuple[str, int]] = None
+        self._search_after_id: Optional[str] = None
+        # LRU of rendered gallery previews keyed by (path, mtime_ns).
+        self._thumb_cache: "OrderedDict[Tuple[Path, int], ImageTk.PhotoImage]" = (
+            OrderedDict()
+        )
+        # Pen strokes are buffered as a flat [x0, y0, x1, y1, ...] list and
+        # shown through a single preview polyline until the button is released.
+        self._stroke_pts: List[int] = []
+        self._preview_line: Optional[int] = None
 
         self._build_ui()
+        self.after(UI_POLL_MS, self._drain_ui_queue)
+
+    def _drain_ui_queue(self) -> None:
+        # Always reschedule, otherwise one failing callback would stop the
+        # UI from ever hearing from the worker threads again.
+        try:
+            while True:
+                try:
+                    callback = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback()
+                except Exception as exc:
+                    print(f"UI callback failed: {exc}")
+        finally:
+            self.after(UI_POLL_MS, self._drain_ui_queue)
+
+    @staticmethod
+    def _open_tesseract_api():
+        if tesserocr is None:
+            return None
+        try:
+            return tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.SINGLE_BLOCK)
+        except RuntimeError as exc:  # pragma: no cover - depends on tessdata
+            print(f"tesserocr unavailable, using pytesseract: {exc}")
+            return None
+
+    def _on_close(self) -> None:
+        self._ocr_pool.shutdown(wait=False)
+        with self._tess_lock:
+            if self._tess is not None:
+                self._tess.End()
+                self._tess = None
+        self.destroy()
 
     # UI SETUP
     def _build_ui(self) -> None:
@@ -144,7 +276,7 @@ class SmartScreenshotApp(tk.Tk):
         self.search_var = tk.StringVar()
         search_entry = tk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=4)
-        search_entry.bind("<KeyRelease>", lambda _event: self.refresh_gallery())
+        search_entry.bind("<KeyRelease>", lambda _event: self._schedule_refresh())
 
         self.canvas = tk.Canvas(
             self, bg="#1e1e1e", width=900, height=520, cursor="cross"
@@ -194,6 +326,8 @@ class SmartScreenshotApp(tk.Tk):
     def clear_canvas(self) -> None:
         self.canvas.delete("all")
         self.preview_shape = None
+        self._preview_line = None
+        self._stroke_pts = []
         self.current_photo = None
         if self.current_image is not None:
             self._render_canvas()
@@ -202,7 +336,9 @@ class SmartScreenshotApp(tk.Tk):
         if not self.current_image:
             return
         self.start_x, self.start_y = event.x, event.y
-        if self.tool == "text":
+        if self.tool == "pen":
+            self._stroke_pts = [event.x, event.y]
+        elif self.tool == "text":
             self._place_text(event.x, event.y)
 
     def on_drag(self, event: tk.Event) -> None:
@@ -215,23 +351,17 @@ class SmartScreenshotApp(tk.Tk):
             return
 
         if self.tool == "pen":
-            self.canvas.create_line(
-                self.start_x,
-                self.start_y,
-                event.x,
-                event.y,
-                fill=self.draw_color,
-                width=self.draw_width,
-                capstyle=tk.ROUND,
-            )
-            draw = ImageDraw.Draw(self.current_image)
-            draw.line(
-                (self.start_x, self.start_y, event.x, event.y),
-                fill=self.draw_color,
-                width=self.draw_width,
-            )
+            self._stroke_pts.extend((event.x, event.y))
+            if self._preview_line is None:
+                self._preview_line = self.canvas.create_line(
+                    *self._stroke_pts,
+                    fill=self.draw_color,
+                    width=self.draw_width,
+                    capstyle=tk.ROUND,
+                )
+            else:
+                self.canvas.coords(self._preview_line, *self._stroke_pts)
             self.start_x, self.start_y = event.x, event.y
-            self._render_canvas(live_only=True)
             return
 
         # Shape preview
@@ -265,6 +395,10 @@ class SmartScreenshotApp(tk.Tk):
         ):
             return
 
+        if self.tool == "pen":
+            self._commit_stroke()
+            return
+
         draw = ImageDraw.Draw(self.current_image)
         coords = (self.start_x, self.start_y, event.x, event.y)
 
@@ -279,6 +413,26 @@ class SmartScreenshotApp(tk.Tk):
             self.preview_shape = None
         self._render_canvas()
 
+    def _commit_stroke(self) -> None:
+        """Replace the live preview with one smoothed polyline and draw it once."""
+        points = self._stroke_pts
+        self._stroke_pts = []
+        self.start_x = self.start_y = None
+        if self._preview_line is not None:
+            self.canvas.delete(self._preview_line)
+            self._preview_line = None
+        if len(points) < 4 or not self.current_image:
+            return
+        self.canvas.create_line(
+            *points,
+            smooth=True,
+            fill=self.draw_color,
+            width=self.draw_width,
+            capstyle=tk.ROUND,
+        )
+        draw = ImageDraw.Draw(self.current_image)
+        draw.line(points, fill=self.draw_color, width=self.draw_width, joint="curve")
+
     def _place_text(self, x: int, y: int) -> None:
         if not self.current_image:
             return
@@ -289,13 +443,12 @@ class SmartScreenshotApp(tk.Tk):
         draw.text((x, y), text, fill=self.draw_color)
         self._render_canvas()
 
-    def _render_canvas(self, live_only: bool = False) -> None:
+    def _render_canvas(self) -> None:
         if not self.current_image:
             self.canvas.delete("all")
             return
         self.current_photo = ImageTk.PhotoImage(self.current_image)
-        if not live_only:
-            self.canvas.delete("all")
+        self.canvas.delete("all")
         self.canvas.create_image(0, 0, anchor=tk.NW, image=self.current_photo)
 
     # Saving & OCR
@@ -311,46 +464,265 @@ class SmartScreenshotApp(tk.Tk):
         )
         if not filename:
             return
-        path = Path(filename)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        self.current_image.save(path)
+        self._io_queue.put((self.current_image.copy(), Path(filename)))
+
+    def _writer_worker(self) -> None:
+        """Encode saved screenshots off the UI thread, then queue them for OCR."""
+        while True:
+            image, path = self._io_queue.get()
+            # Any failure is reported to the UI; the loop must keep running or
+            # every later save would sit in the queue forever.
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                image.save(path, compress_level=PNG_COMPRESS_LEVEL)
+                thumb = self._write_thumbnail(image, path)
+                mtime_ns = path.stat().st_mtime_ns
+                self._ocr_queue.put(path)
+                self._ui_queue.put(
+                    functools.partial(self._on_saved, path, mtime_ns, thumb)
+                )
+            except Exception as exc:
+                self._ui_queue.put(
+                    functools.partial(
+                        messagebox.showerror, APP_NAME, f"Could not save {path}: {exc}"
+                    )
+                )
+
+    def _on_saved(self, path: Path, mtime_ns: int, thumb: Image.Image) -> None:
+        self._cache_thumbnail((path, mtime_ns), ImageTk.PhotoImage(thumb))
         messagebox.showinfo(APP_NAME, f"Saved screenshot to {path}")
-        threading.Thread(target=self._ocr_and_index, args=(path,), daemon=True).start()
         self.refresh_gallery()
 
-    def _ocr_and_index(self, image_path: Path) -> None:
+    def _ocr_worker(self) -> None:
+        """Drain the OCR queue, grouping captures that arrive close together.
+
+        Each batch is handed to the bounded OCR pool so bursts of captures are
+        recognised in parallel without spawning a thread per screenshot.
+        """
+        while True:
+            batch = [self._ocr_queue.get()]
+            while len(batch) < OCR_BATCH_SIZE:
+                try:
+                    batch.append(self._ocr_queue.get(timeout=OCR_BATCH_WAIT))
+                except queue.Empty:
+                    break
+            try:
+                self._ocr_pool.submit(self._ocr_and_index, batch)
+            except RuntimeError:  # pool shut down while the window closes
+                return
+
+    def _ocr_and_index(self, image_paths: List[Path]) -> None:
         try:
-            text = pytesseract.image_to_string(image_path)
+            texts = self._ocr_batch(image_paths)
         except Exception as exc:  # pragma: no cover - depends on local tesseract
-            text = ""
+            texts = [""] * len(image_paths)
             print(f"OCR failed: {exc}")
-        self.index.index_image(image_path, text)
-        self.refresh_gallery()
+        self.index.index_bulk(list(zip(image_paths, texts)))
+        self._ui_queue.put(self.refresh_gallery)
+
+    def _ocr_batch(self, image_paths: List[Path]) -> List[str]:
+        """OCR a batch of screenshots, downscaling oversized captures first."""
+        with tempfile.TemporaryDirectory(prefix="ocr-") as workdir:
+            sources = [
+                self._prepare_for_ocr(path, Path(workdir) / f"{position}.png")
+                for position, path in enumerate(image_paths)
+            ]
+            return self._recognise(sources, Path(workdir))
+
+    @staticmethod
+    def _prepare_for_ocr(image_path: Path, scratch_path: Path) -> Path:
+        """Return a path to an OCR-ready copy of ``image_path``.
+
+        With OpenCV available the capture is converted to grayscale,
+        downscaled and binarised with an adaptive threshold, which gives
+        tesseract clean glyphs on colourful UI backgrounds. Otherwise it is
+        only downscaled (libvips shrink-on-load, then Pillow) and images that
+        already fit within ``OCR_MAX_DIMENSION`` are used as is.
+        """
+        if cv2 is not None:
+            gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+            if gray is not None:
+                height, width = gray.shape
+                scale = OCR_MAX_DIMENSION / max(height, width)
+                if scale < 1:
+                    gray = cv2.resize(
+                        gray,
+                        (round(width * scale), round(height * scale)),
+                        interpolation=cv2.INTER_AREA,
+                    )
+                binary = cv2.adaptiveThreshold(
+                    gray,
+                    255,
+                    cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                    cv2.THRESH_BINARY,
+                    THRESHOLD_BLOCK_SIZE,
+                    THRESHOLD_OFFSET,
+                )
+                cv2.imwrite(str(scratch_path), binary, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                return scratch_path
+        if pyvips is not None:
+            header = pyvips.Image.new_from_file(str(image_path), access="sequential")
+            if max(header.width, header.height) <= OCR_MAX_DIMENSION:
+                return image_path
+            thumb = pyvips.Image.thumbnail(
+                str(image_path), OCR_MAX_DIMENSION, size="down"
+            )
+            thumb.write_to_file(str(scratch_path))
+            return scratch_path
+        with Image.open(image_path) as image:
+            if max(image.size) <= OCR_MAX_DIMENSION:
+                return image_path
+            image.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.LANCZOS)
+            image.save(scratch_path, compress_level=1)
+        return scratch_path
+
+    def _recognise(self, sources: List[Path], workdir: Path) -> List[str]:
+        """Run OCR and keep only words recognised with enough confidence.
+
+        The persistent tesserocr API is used when available. Otherwise the
+        batch is handed to a single tesseract process through an image list
+        file, and words are mapped back to their image by page number.
+        """
+        with self._tess_lock:
+            if self._tess is not None:
+                texts = []
+                for path in sources:
+                    self._tess.SetImageFile(str(path))
+                    texts.append(self._confident_words(self._tess))
+                return texts
+        if len(sources) == 1:
+            target = str(sources[0])
+        else:
+            listing = workdir / "list_of_images.txt"
+            listing.write_text(
+                "\n".join(str(path) for path in sources), encoding="utf-8"
+            )
+            target = str(listing)
+        data = pytesseract.image_to_data(
+            target, config=TESSERACT_CONFIG, output_type=pytesseract.Output.DICT
+        )
+        pages: List[List[str]] = [[] for _ in sources]
+        for page_num, word, conf in zip(data["page_num"], data["text"], data["conf"]):
+            if 0 < page_num <= len(pages) and word.strip():
+                if float(conf) > OCR_MIN_CONFIDENCE:
+                    pages[page_num - 1].append(word)
+        return [" ".join(words) for words in pages]
+
+    @staticmethod
+    def _confident_words(api) -> str:
+        api.Recognize()
+        iterator = api.GetIterator()
+        if iterator is None:
+            return ""
+        level = tesserocr.RIL.WORD
+        words = []
+        for word in tesserocr.iterate_level(iterator, level):
+            text = word.GetUTF8Text(level)
+            if text and word.Confidence(level) > OCR_MIN_CONFIDENCE:
+                words.append(text)
+        return " ".join(words)
 
     # Gallery
+    def _schedule_refresh(self) -> None:
+        """Debounce keystrokes so the gallery is queried once typing pauses."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self.refresh_gallery)
+
     def refresh_gallery(self) -> None:
+        self._search_after_id = None
         query = self.search_var.get()
+        gallery_key = (query, self.index.version)
+        if gallery_key == self._gallery_key:
+            return
+        self._gallery_key = gallery_key
         rows = self.index.search(query)
+        basename = os.path.basename
+        labels = [
+            f"{basename(path)} — {created.partition('T')[0] if created else ''}"
+            for path, created in rows
+        ]
         self.gallery_list.delete(0, tk.END)
-        for path, created in rows:
-            timestamp = created.split("T")[0] if created else ""
-            self.gallery_list.insert(tk.END, f"{Path(path).name} — {timestamp}")
-        self.gallery_paths = [Path(path) for path, _ in rows]
+        if labels:
+            # One Tcl call for the whole list instead of one per row.
+            self.gallery_list.insert(tk.END, *labels)
+        # Kept as strings; a Path is only built for the entry being previewed.
+        self.gallery_paths = [path for path, _ in rows]
 
     def preview_selected(self) -> None:
         if not self.gallery_list.curselection():
             return
         idx = self.gallery_list.curselection()[0]
-        path = self.gallery_paths[idx]
+        path = Path(self.gallery_paths[idx])
         if not path.exists():
             messagebox.showwarning(APP_NAME, f"File missing: {path}")
             return
-        image = Image.open(path)
-        image.thumbnail((320, 320))
-        photo = ImageTk.PhotoImage(image)
+        photo = self._thumbnail(path)
         self.preview_label.configure(image=photo)
         self.preview_label.image = photo
 
+    def _thumbnail(self, path: Path) -> ImageTk.PhotoImage:
+        key = (path, path.stat().st_mtime_ns)
+        photo = self._thumb_cache.get(key)
+        if photo is not None:
+            self._thumb_cache.move_to_end(key)
+            return photo
+        photo = ImageTk.PhotoImage(self._load_thumbnail(path))
+        self._cache_thumbnail(key, photo)
+        return photo
+
+    def _cache_thumbnail(
+        self, key: Tuple[Path, int], photo: ImageTk.PhotoImage
+    ) -> None:
+        self._thumb_cache[key] = photo
+        self._thumb_cache.move_to_end(key)
+        if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+
+    @staticmethod
+    def _write_thumbnail(image: Image.Image, path: Path) -> Image.Image:
+        """Build the preview from the in-memory image right after saving.
+
+        The thumbnail is returned for the session cache and written next to
+        the screenshot as a small JPEG sidecar so later sessions skip
+        decoding the full-size file. ``image`` is shrunk in place.
+        """
+        image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.LANCZOS)
+        try:
+            image.convert("RGB").save(path.with_suffix(THUMB_SUFFIX), "JPEG")
+        except OSError as exc:
+            print(f"Could not write thumbnail for {path}: {exc}")
+        return image
+
+    @staticmethod
+    def _load_thumbnail(path: Path) -> Image.Image:
+        """Decode ``path`` at preview size.
+
+        A sidecar thumbnail newer than the screenshot is preferred; otherwise
+        the image is shrunk on load with libvips if present, or with Pillow.
+        """
+        sidecar = path.with_suffix(THUMB_SUFFIX)
+        try:
+            if sidecar.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                # Decode now so the file is closed before the image is returned
+                with Image.open(sidecar) as image:
+                    image.load()
+                return image
+        except FileNotFoundError:
+            pass
+        if pyvips is not None:
+            thumb = pyvips.Image.thumbnail(str(path), THUMBNAIL_SIZE)
+            if thumb.format != "uchar":
+                thumb = thumb.cast("uchar")
+            return Image.frombytes(
+                VIPS_BAND_MODES[thumb.bands],
+                (thumb.width, thumb.height),
+                thumb.write_to_memory(),
+            )
+        with Image.open(path) as image:
+            image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        return image
+
 
 def main() -> None:
     base_path = Path(__file__).resolve().parent
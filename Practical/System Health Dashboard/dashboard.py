@@ -1,3 +1,4 @@
+import heapq
 import time
 
 import psutil
@@ -11,54 +12,63 @@ from rich.table import Table
 console = Console()
 
 
-def get_cpu_panel():
-    cpu_percent = psutil.cpu_percent(interval=0, percpu=True)
-    avg_cpu = sum(cpu_percent) / len(cpu_percent)
-
-    table = Table(show_header=False, expand=True, box=None)
-    table.add_column("Core", ratio=1)
-    table.add_column("Usage", ratio=2)
-
-    for i, usage in enumerate(cpu_percent):
-        color = "green" if usage < 50 else "yellow" if usage < 80 else "red"
-        bar_length = 20
-        filled = int(usage / 100 * bar_length)
-        bar = "█" * filled + "░" * (bar_length - filled)
-        table.add_row(f"Core {i}", f"[{color}]{bar} {usage:.1f}%[/{color}]")
-
-    return Panel(
-        Align.center(table),
-        title=f"CPU Usage (Avg: {avg_cpu:.1f}%)",
-        border_style="blue",
-    )
-
-
-def get_memory_panel():
-    mem = psutil.virtual_memory()
-    swap = psutil.swap_memory()
-
-    table = Table(show_header=False, expand=True, box=None)
-    table.add_column("Type", ratio=1)
-    table.add_column("Usage", ratio=2)
+def _usage_bar(percent):
+    color = "green" if percent < 50 else "yellow" if percent < 80 else "red"
+    bar_length = 20
+    filled = int(percent / 100 * bar_length)
+    return f"[{color}]{'█' * filled + '░' * (bar_length - filled)} {percent:.1f}%[/{color}]"
+
+
+# Panels with a fixed set of rows are built once; each tick only overwrites
+# their cell strings instead of constructing new Table and Panel objects.
+class CPUPanel:
+    def __init__(self):
+        cores = len(psutil.cpu_percent(interval=0, percpu=True))
+        self.table = Table(show_header=False, expand=True, box=None)
+        self.table.add_column("Core", ratio=1)
+        self.table.add_column("Usage", ratio=2)
+        for i in range(cores):
+            self.table.add_row(f"Core {i}", "")
+        self.panel = Panel(
+            Align.center(self.table), title="CPU Usage", border_style="blue"
+        )
 
-    def make_bar(percent):
-        color = "green" if percent < 50 else "yellow" if percent < 80 else "red"
-        bar_length = 20
-        filled = int(percent / 100 * bar_length)
-        return f"[{color}]{'█' * filled + '░' * (bar_length - filled)} {percent:.1f}%[/{color}]"
+    def update(self):
+        cpu_percent = psutil.cpu_percent(interval=0, percpu=True)
+        cells = self.table.columns[1]._cells
+        for i, usage in enumerate(cpu_percent[: len(cells)]):
+            cells[i] = _usage_bar(usage)
+        avg_cpu = sum(cpu_percent) / len(cpu_percent)
+        self.panel.title = f"CPU Usage (Avg: {avg_cpu:.1f}%)"
+
+    def __rich__(self):
+        return self.panel
+
+
+class MemoryPanel:
+    def __init__(self):
+        self.table = Table(show_header=False, expand=True, box=None)
+        self.table.add_column("Type", ratio=1)
+        self.table.add_column("Usage", ratio=2)
+        for _ in range(4):
+            self.table.add_row("", "")
+        self.panel = Panel(
+            Align.center(self.table), title="Memory Usage", border_style="green"
+        )
 
-    table.add_row("RAM", make_bar(mem.percent))
-    table.add_row(
-        f"  Used: {mem.used / (1024**3):.1f} GB",
-        f"Total: {mem.total / (1024**3):.1f} GB",
-    )
-    table.add_row("Swap", make_bar(swap.percent))
-    table.add_row(
-        f"  Used: {swap.used / (1024**3):.1f} GB",
-        f"Total: {swap.total / (1024**3):.1f} GB",
-    )
+    def update(self):
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        labels = self.table.columns[0]._cells
+        values = self.table.columns[1]._cells
+        for row, name, usage in ((0, "RAM", mem), (2, "Swap", swap)):
+            labels[row] = name
+            values[row] = _usage_bar(usage.percent)
+            labels[row + 1] = f"  Used: {usage.used / (1024**3):.1f} GB"
+            values[row + 1] = f"Total: {usage.total / (1024**3):.1f} GB"
 
-    return Panel(Align.center(table), title="Memory Usage", border_style="green")
+    def __rich__(self):
+        return self.panel
 
 
 def get_disk_panel():
@@ -87,28 +97,69 @@ def get_disk_panel():
     return Panel(Align.center(table), title="Disk Usage", border_style="magenta")
 
 
-def get_network_panel():
-    net_io = psutil.net_io_counters()
-    table = Table(show_header=False, expand=True, box=None)
-    table.add_row("Bytes Sent", f"{net_io.bytes_sent / (1024**2):.2f} MB")
-    table.add_row("Bytes Recv", f"{net_io.bytes_recv / (1024**2):.2f} MB")
-    table.add_row("Packets Sent", f"{net_io.packets_sent}")
-    table.add_row("Packets Recv", f"{net_io.packets_recv}")
+class NetworkPanel:
+    def __init__(self):
+        self.table = Table(show_header=False, expand=True, box=None)
+        for label in ("Bytes Sent", "Bytes Recv", "Packets Sent", "Packets Recv"):
+            self.table.add_row(label, "")
+        self.panel = Panel(
+            Align.center(self.table), title="Network Traffic", border_style="cyan"
+        )
 
-    return Panel(Align.center(table), title="Network Traffic", border_style="cyan")
+    def update(self):
+        net_io = psutil.net_io_counters()
+        self.table.columns[1]._cells[:] = [
+            f"{net_io.bytes_sent / (1024**2):.2f} MB",
+            f"{net_io.bytes_recv / (1024**2):.2f} MB",
+            f"{net_io.packets_sent}",
+            f"{net_io.packets_recv}",
+        ]
 
+    def __rich__(self):
+        return self.panel
+
+
+# Process handles kept between refreshes: new PIDs are added and exited ones
+# dropped, and cpu_percent(None) reports the delta since the previous tick.
+_procs = {}
+
+
+def _sample_processes():
+    current = set(psutil.pids())
+    for pid in _procs.keys() - current:
+        del _procs[pid]
+    for pid in current - _procs.keys():
+        try:
+            _procs[pid] = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            pass
 
-def get_process_panel():
     processes = []
-    for p in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent"]):
+    for pid, proc in list(_procs.items()):
         try:
-            processes.append(p.info)
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            # oneshot() caches the /proc reads shared by the calls below.
+            with proc.oneshot():
+                processes.append(
+                    {
+                        "pid": pid,
+                        "name": proc.name(),
+                        "cpu_percent": proc.cpu_percent(None),
+                        "memory_percent": proc.memory_percent(),
+                    }
+                )
+        except psutil.NoSuchProcess:
+            # Also covers ZombieProcess.
+            del _procs[pid]
+        except psutil.AccessDenied:
             pass
+    return processes
+
 
-    # Sort by CPU usage
-    processes.sort(key=lambda x: x["cpu_percent"] or 0, reverse=True)
-    top_processes = processes[:10]
+def get_process_panel():
+    # Only the top ten by CPU usage are shown.
+    top_processes = heapq.nlargest(
+        10, _sample_processes(), key=lambda x: x["cpu_percent"]
+    )
 
     table = Table(show_header=True, expand=True, box=None)
     table.add_column("PID", justify="right")
@@ -137,14 +188,17 @@ def make_layout():
         Layout(name="disk_net", ratio=1), Layout(name="procs", ratio=1)
     )
     layout["disk_net"].split_column(Layout(name="disk"), Layout(name="network"))
+    layout["cpu"].update(CPUPanel())
+    layout["memory"].update(MemoryPanel())
+    layout["network"].update(NetworkPanel())
     return layout
 
 
 def update_layout(layout):
-    layout["cpu"].update(get_cpu_panel())
-    layout["memory"].update(get_memory_panel())
+    for name in ("cpu", "memory", "network"):
+        layout[name].renderable.update()
+    # Disks and the process list change shape, so they are rebuilt.
     layout["disk"].update(get_disk_panel())
-    layout["network"].update(get_network_panel())
     layout["procs"].update(get_process_panel())
 
 
@@ -6,32 +6,56 @@ to list available units and perform conversions.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional, Tuple
 
 # Hack to support running as a script despite spaces in folder name
 sys.path.append(os.path.dirname(__file__))
 
-from fastapi import Depends, FastAPI, HTTPException
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 try:
     from .unit_converter import (
         CategoryNotFound,
+        ConfigurationError,
         ConversionDataSource,
+        UnitConversionError,
         UnitConverter,
         UnitNotFound,
     )
 except ImportError:
     from unit_converter import (
         CategoryNotFound,
+        ConfigurationError,
         ConversionDataSource,
+        UnitConversionError,
         UnitConverter,
         UnitNotFound,
     )
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    ORJSONResponse = None
+
+logger = logging.getLogger(__name__)
+
+# orjson encodes responses in native code; fall back to the stdlib encoder.
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
+
+# How often the running app checks the configuration file for changes.
+REFRESH_INTERVAL_SECONDS = 1.0
+
 
 def _build_converter(config_path: Optional[str] = None) -> UnitConverter:
     """Factory to create a configured UnitConverter."""
@@ -40,7 +64,24 @@ def _build_converter(config_path: Optional[str] = None) -> UnitConverter:
         str(Path(__file__).with_name("config").joinpath("sample_units.json")),
     )
     data_source = ConversionDataSource(config_file)
-    return UnitConverter(data_source)
+    return UnitConverter(data_source, auto_refresh=False)
+
+
+async def _refresh_periodically(converter: UnitConverter, interval: float) -> None:
+    """Reload the converter's tables in the background while the app runs."""
+    while True:
+        await asyncio.sleep(interval)
+        version = converter.version
+        try:
+            # Parsing and rebuilding the tables is blocking work; keep it off
+            # the event loop so requests are served while it runs.
+            await asyncio.to_thread(converter.refresh)
+        except (ConfigurationError, UnitConversionError) as exc:
+            # Keep serving the last good configuration until the file is fixed.
+            logger.warning("Could not reload unit configuration: %s", exc)
+            continue
+        if converter.version != version:
+            await asyncio.to_thread(converter.warm_cache)
 
 
 class ConversionPayload(BaseModel):
@@ -63,6 +104,25 @@ class ConversionResponse(BaseModel):
     converted_value: float
 
 
+class BatchPayload(BaseModel):
+    """Request payload for converting many values between the same units."""
+
+    category: str = Field(..., description="Unit category, e.g. 'length'.")
+    from_unit: str = Field(..., description="Source unit name or alias.")
+    to_unit: str = Field(..., description="Target unit name or alias.")
+    values: list[float] = Field(..., description="Values to convert.")
+
+
+class BatchResponse(BaseModel):
+    """Response payload for batch conversion."""
+
+    category: str
+    from_unit: str
+    to_unit: str
+    factor: float
+    converted_values: list[float]
+
+
 class CategoryResponse(BaseModel):
     """Schema for category metadata."""
 
@@ -79,7 +139,28 @@ class UnitsResponse(BaseModel):
 def create_app(config_path: Optional[str] = None) -> FastAPI:
     """Create and configure the FastAPI application."""
     converter = _build_converter(config_path)
-    app = FastAPI(title="Universal Unit Converter", version="1.0.0")
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        converter.warm_cache()
+        task = asyncio.create_task(
+            _refresh_periodically(converter, REFRESH_INTERVAL_SECONDS)
+        )
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    app = FastAPI(
+        title="Universal Unit Converter",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=DEFAULT_RESPONSE_CLASS,
+    )
+    # Serialized /units payload and the data source version it was built from.
+    units_cache: Optional[Tuple[int, bytes]] = None
 
     def get_converter() -> UnitConverter:
         return converter
@@ -87,8 +168,12 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
     @app.get("/units", response_model=UnitsResponse)
     def list_units(
         conv: UnitConverter = Depends(get_converter),
-    ) -> UnitsResponse:
+    ) -> Response:
         """List all supported unit categories and units."""
+        nonlocal units_cache
+        version = conv.version
+        if units_cache is not None and units_cache[0] == version:
+            return Response(content=units_cache[1], media_type="application/json")
         categories = conv.list_categories()
         # Transform the raw dict to the pydantic model structure
         # categories structure from converter: {name: {"description": ..., "units": [...]}}
@@ -99,13 +184,21 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
                 description=str(v.get("description", "")),
                 units=v.get("units", []),  # type: ignore
             )
-        return UnitsResponse(categories=typed)
-
-    @app.post("/convert", response_model=ConversionResponse)
+        body = UnitsResponse(categories=typed).model_dump_json().encode()
+        units_cache = (version, body)
+        return Response(content=body, media_type="application/json")
+
+    # The handler builds the payload from trusted values, so it skips response
+    # validation; the model is still published in the OpenAPI schema.
+    @app.post(
+        "/convert",
+        response_model=None,
+        responses={200: {"model": ConversionResponse}},
+    )
     def convert_units(
         payload: ConversionPayload,
         conv: UnitConverter = Depends(get_converter),
-    ) -> ConversionResponse:
+    ) -> Dict[str, object]:
         """Perform a unit conversion."""
         try:
             result = conv.convert(
@@ -119,13 +212,37 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         except UnitNotFound as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-        return ConversionResponse(
-            category=result.category,
-            from_unit=result.from_unit,
-            to_unit=result.to_unit,
-            value=result.value,
-            factor=result.factor,
-            converted_value=result.converted_value,
+        return {
+            "category": result.category,
+            "from_unit": result.from_unit,
+            "to_unit": result.to_unit,
+            "value": result.value,
+            "factor": result.factor,
+            "converted_value": result.converted_value,
+        }
+
+    @app.post("/convert_batch", response_model=BatchResponse)
+    def convert_batch(
+        payload: BatchPayload,
+        conv: UnitConverter = Depends(get_converter),
+    ) -> BatchResponse:
+        """Convert a list of values with a single factor lookup."""
+        try:
+            source, target, factor = conv.factor_for(
+                payload.category, payload.from_unit, payload.to_unit
+            )
+        except CategoryNotFound as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        except UnitNotFound as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+        converted = np.asarray(payload.values, dtype=np.float64) * factor
+        return BatchResponse(
+            category=payload.category,
+            from_unit=source,
+            to_unit=target,
+            factor=factor,
+            converted_values=converted.tolist(),
         )
 
     return app
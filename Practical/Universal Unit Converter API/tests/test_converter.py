@@ -35,7 +35,7 @@ def config_file(tmp_path: Path) -> Path:
 
 @pytest.fixture()
 def converter(config_file: Path) -> UnitConverter:
-    return UnitConverter(ConversionDataSource(config_file))
+    return UnitConverter(ConversionDataSource(config_file, check_interval=0))
 
 
 def test_basic_conversion(converter: UnitConverter):
@@ -78,3 +78,34 @@ def test_reload_when_file_changes(converter: UnitConverter, config_file: Path):
     os.utime(config_file, (new_time, new_time))
     result = converter.convert("length", "kilometer", "meter", 1)
     assert pytest.approx(result.converted_value) == 1000
+
+
+def test_file_checks_are_throttled(config_file: Path):
+    data_source = ConversionDataSource(config_file, check_interval=60)
+    converter = UnitConverter(data_source)
+    updated_data = json.loads(config_file.read_text())
+    updated_data["categories"]["length"]["units"]["kilometer"] = {"to_base": 1000}
+    config_file.write_text(json.dumps(updated_data))
+    new_time = config_file.stat().st_mtime + 1
+    os.utime(config_file, (new_time, new_time))
+    # Loaded moments ago, so the edit is not noticed until the interval passes
+    with pytest.raises(UnitNotFound):
+        converter.convert("length", "kilometer", "meter", 1)
+    data_source.load(force=True)
+    result = converter.convert("length", "kilometer", "meter", 1)
+    assert pytest.approx(result.converted_value) == 1000
+
+
+def test_touched_file_keeps_tables(converter: UnitConverter, config_file: Path):
+    version = converter.version
+    new_time = config_file.stat().st_mtime + 1
+    os.utime(config_file, (new_time, new_time))
+    converter.convert("length", "cm", "m", 1)
+    assert converter.data_source.version > 1
+    assert converter.version == version
+
+
+def test_warm_cache_covers_canonical_pairs(converter: UnitConverter):
+    assert converter.warm_cache() == 16
+    converter.convert("length", "mile", "inch", 1)
+    assert converter._get_factor.cache_info().hits == 1
@@ -1,9 +1,12 @@
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
+from Practical.UniversalUnitConverter import app as app_module
 from Practical.UniversalUnitConverter.app import create_app
 
 
@@ -68,3 +71,35 @@ def test_invalid_unit_returns_error(client: TestClient):
     )
     assert response.status_code == 400
     assert "Unknown unit" in response.json()["detail"]
+
+
+def test_convert_batch_endpoint(client: TestClient):
+    response = client.post(
+        "/convert_batch",
+        json={
+            "category": "mass",
+            "from_unit": "kg",
+            "to_unit": "g",
+            "values": [1, 2.5],
+        },
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["from_unit"] == "kilogram"
+    assert payload["converted_values"] == pytest.approx([1000, 2500])
+
+
+def test_running_app_picks_up_config_changes(config_file: Path, monkeypatch):
+    monkeypatch.setattr(app_module, "REFRESH_INTERVAL_SECONDS", 0.05)
+    with TestClient(create_app(str(config_file))) as client:
+        data = json.loads(config_file.read_text())
+        data["categories"]["mass"]["units"]["tonne"] = {"to_base": 1000}
+        config_file.write_text(json.dumps(data))
+        new_time = config_file.stat().st_mtime + 1
+        os.utime(config_file, (new_time, new_time))
+        deadline = time.monotonic() + 5
+        units = []
+        while "tonne" not in units and time.monotonic() < deadline:
+            time.sleep(0.05)
+            units = client.get("/units").json()["categories"]["mass"]["units"]
+        assert "tonne" in units
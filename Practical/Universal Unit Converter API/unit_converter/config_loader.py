@@ -4,11 +4,22 @@ from __future__ import annotations
 
 import json
 import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# libyaml's loader is much faster than the pure-Python one when available.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so errors match.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class ConfigurationError(RuntimeError):
     """Raised when the configuration file cannot be parsed."""
@@ -19,13 +30,16 @@ class ConversionDataSource:
 
     The loader keeps the parsed configuration in memory and only reloads the
     source file when it changes on disk or when ``force=True`` is passed to
-    :meth:`load`.
+    :meth:`load`. The file is stat'ed at most once per ``check_interval``
+    seconds, so edits can take that long to be picked up.
     """
 
-    def __init__(self, path: Path | str):
+    def __init__(self, path: Path | str, check_interval: float = 1.0):
         self.path = Path(path)
         self._data: Optional[Dict[str, Any]] = None
         self._last_mtime: Optional[float] = None
+        self._last_check = 0.0
+        self._check_interval = check_interval
         self._lock = threading.Lock()
         self._version = 0
 
@@ -35,10 +49,15 @@ class ConversionDataSource:
 
     def load(self, force: bool = False) -> Dict[str, Any]:
         """Return the parsed configuration, reloading it if necessary."""
+        # Lock-free fast path; a due check or reload re-checks under the lock.
+        data = self._data
+        if not force and data is not None and not self._check_due():
+            return data
         with self._lock:
             if force or self._needs_reload():
                 self._data = self._read_file()
                 self._version += 1
+                self._last_check = time.monotonic()
                 try:
                     self._last_mtime = self.path.stat().st_mtime
                 except FileNotFoundError:
@@ -48,9 +67,15 @@ class ConversionDataSource:
             return self._data
 
     # ------------------------------------------------------------------
+    def _check_due(self) -> bool:
+        return time.monotonic() - self._last_check >= self._check_interval
+
     def _needs_reload(self) -> bool:
         if self._data is None:
             return True
+        if not self._check_due():
+            return False
+        self._last_check = time.monotonic()
         try:
             current_mtime = self.path.stat().st_mtime
         except FileNotFoundError as exc:
@@ -66,9 +91,9 @@ class ConversionDataSource:
         suffix = self.path.suffix.lower()
         try:
             if suffix == ".json":
-                return json.loads(text)
+                return _json_loads(text)
             if suffix in {".yaml", ".yml"}:
-                return yaml.safe_load(text)
+                return yaml.load(text, Loader=YamlLoader)
         except (json.JSONDecodeError, yaml.YAMLError) as exc:
             raise ConfigurationError(f"Failed to parse configuration: {exc}") from exc
         raise ConfigurationError(
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import sys
+import threading
 from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from .config_loader import ConversionDataSource
 
+# Distinct (category, from, to) request triples kept in the factor cache.
+FACTOR_CACHE_SIZE = 2048
+
 
 class UnitConversionError(RuntimeError):
     """Base error for conversion problems."""
@@ -32,45 +40,83 @@ class ConversionResult:
     to_unit: str
     factor: float
     value: float
+    converted_value: float
 
-    @property
-    def converted_value(self) -> float:
-        return self.value * self.factor
+
+@dataclass(slots=True)
+class CategoryTable:
+    """Everything needed to convert within one category."""
+
+    units: Dict[str, float]
+    unit_names: List[str]
+    # Aliases and canonical names, both mapped to the canonical name; a
+    # canonical name wins over an alias spelled the same way.
+    resolver: Dict[str, str]
+    pairwise: Dict[Tuple[str, str], float]
+    description: str = ""
 
 
 class UnitConverter:
-    """Performs conversions using the metadata provided by a data source."""
+    """Performs conversions using the metadata provided by a data source.
 
-    def __init__(self, data_source: ConversionDataSource):
+    With ``auto_refresh`` (the default) every call checks the data source for
+    changes first. Callers that refresh on their own schedule can turn it off
+    and call :meth:`refresh` themselves.
+    """
+
+    def __init__(self, data_source: ConversionDataSource, auto_refresh: bool = True):
         self.data_source = data_source
-        self._categories: Dict[str, Dict[str, float]] = {}
-        self._graphs: Dict[str, Dict[str, Dict[str, float]]] = {}
-        self._aliases: Dict[str, Dict[str, str]] = {}
-        self._descriptions: Dict[str, str] = {}
-        self._factor_cache: Dict[Tuple[str, str, str], float] = {}
+        self.auto_refresh = auto_refresh
+        self._tables: Dict[str, CategoryTable] = {}
+        # Keyed on the raw request strings, so aliases skip resolution too,
+        # and on the content version, so a factor computed from the old tables
+        # while they are swapped can never be served afterwards.
+        self._get_factor = lru_cache(maxsize=FACTOR_CACHE_SIZE)(self._compute_factor)
+        # Serialises table swaps; lookups stay lock-free.
+        self._lock = threading.Lock()
         self._data_version = -1
-        self._ensure_latest()
+        # Bumped only when the parsed configuration actually differs, so a
+        # touched or re-saved file keeps the tables and downstream caches.
+        self._content_version = 0
+        self._config_hash: Optional[bytes] = None
+        self._listing: Optional[Tuple[int, Dict[str, Dict[str, object]]]] = None
+        self.refresh()
+
+    @property
+    def version(self) -> int:
+        """Version of the configuration content the tables were built from."""
+        return self._content_version
 
     # ------------------------------------------------------------------
-    def _ensure_latest(self) -> None:
+    def refresh(self) -> None:
+        """Rebuild the conversion tables if the data source has changed."""
         data = self.data_source.load()
         if self._data_version == self.data_source.version:
             return
-        self._build_categories(data)
-        self._factor_cache.clear()
+        config_hash = self._hash_config(data)
+        if config_hash != self._config_hash:
+            tables = self._build_categories(data)
+            with self._lock:
+                self._tables = tables
+                self._get_factor.cache_clear()
+                self._content_version += 1
+            self._config_hash = config_hash
         self._data_version = self.data_source.version
 
-    def _build_categories(self, data: Dict[str, Dict]) -> None:
+    @staticmethod
+    def _hash_config(data: Dict[str, Dict]) -> bytes:
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+    def _build_categories(self, data: Dict[str, Dict]) -> Dict[str, CategoryTable]:
         categories = data.get("categories")
         if not isinstance(categories, dict):
             raise InvalidConfiguration(
                 "Configuration must include a 'categories' mapping"
             )
-        self._categories.clear()
-        self._graphs.clear()
-        self._aliases.clear()
-        self._descriptions.clear()
+        tables: Dict[str, CategoryTable] = {}
         for category_name, config in categories.items():
+            category_name = sys.intern(category_name)
             units = config.get("units")
             if not units:
                 raise InvalidConfiguration(
@@ -93,9 +139,10 @@ class UnitConverter:
                     raise InvalidConfiguration(
                         f"Unit '{unit_name}' in '{category_name}' must have a positive factor"
                     )
+                unit_name = sys.intern(unit_name)
                 processed_units[unit_name] = float(factor)
                 for alias in aliases:
-                    alias_map[alias] = unit_name
+                    alias_map[sys.intern(alias)] = unit_name
             base_unit = config.get("base_unit")
             if not base_unit:
                 base_unit = next(iter(processed_units))
@@ -103,12 +150,36 @@ class UnitConverter:
                 raise InvalidConfiguration(
                     f"Base unit '{base_unit}' is not defined in '{category_name}'"
                 )
-            self._categories[category_name] = processed_units
-            self._aliases[category_name] = alias_map
-            self._descriptions[category_name] = config.get("description", "")
-            self._graphs[category_name] = self._build_graph(
-                processed_units, base_unit, config.get("relationships", [])
+            tables[category_name] = CategoryTable(
+                units=processed_units,
+                unit_names=sorted(processed_units),
+                resolver={**alias_map, **{unit: unit for unit in processed_units}},
+                pairwise=self._build_pairwise(
+                    processed_units, base_unit, config.get("relationships", [])
+                ),
+                description=config.get("description", ""),
             )
+        return tables
+
+    def _build_pairwise(
+        self, units: Dict[str, float], base_unit: str, relationships: List[Dict]
+    ) -> Dict[Tuple[str, str], float]:
+        if relationships:
+            # Explicit relationships can override the base-unit ratio, so the
+            # factors come from walking the graph once per source unit.
+            graph = self._build_graph(units, base_unit, relationships)
+            return {
+                (source, target): factor
+                for source in graph
+                for target, factor in self._walk_graph(graph, source).items()
+            }
+        # Every unit is connected through the base unit, so any pair's factor
+        # is simply the ratio of their base factors.
+        return {
+            (source, target): source_factor / target_factor
+            for source, source_factor in units.items()
+            for target, target_factor in units.items()
+        }
 
     def _build_graph(
         self, units: Dict[str, float], base_unit: str, relationships: List[Dict]
@@ -145,56 +216,91 @@ class UnitConverter:
 
     # ------------------------------------------------------------------
     def list_categories(self) -> Dict[str, Dict[str, object]]:
-        self._ensure_latest()
+        """Describe each category; the result is shared, so treat it as read-only."""
+        if self.auto_refresh:
+            self.refresh()
+        # The version is bumped after the tables are swapped, so reading it
+        # first never pairs a new version with old tables.
+        version = self._content_version
+        tables = self._tables
+        if self._listing is not None and self._listing[0] == version:
+            return self._listing[1]
         response: Dict[str, Dict[str, object]] = {}
-        for name, units in self._categories.items():
+        for name, table in tables.items():
             response[name] = {
-                "description": self._descriptions.get(name, ""),
-                "units": sorted(units.keys()),
+                "description": table.description,
+                "units": table.unit_names,
             }
+        self._listing = (version, response)
         return response
 
     def convert(
         self, category: str, from_unit: str, to_unit: str, value: float
     ) -> ConversionResult:
-        self._ensure_latest()
-        canonical_category = self._categories.get(category)
-        if canonical_category is None:
+        source, target, factor = self.factor_for(category, from_unit, to_unit)
+        value = float(value)
+        return ConversionResult(category, source, target, factor, value, value * factor)
+
+    def factor_for(
+        self, category: str, from_unit: str, to_unit: str
+    ) -> Tuple[str, str, float]:
+        """Return the canonical unit names and the factor between them."""
+        if self.auto_refresh:
+            self.refresh()
+        return self._get_factor(self._content_version, category, from_unit, to_unit)
+
+    def warm_cache(self) -> int:
+        """Fill the factor cache with canonical unit pairs; return how many."""
+        warmed = 0
+        version = self._content_version
+        tables = self._tables
+        try:
+            for category, table in tables.items():
+                for source, target in table.pairwise:
+                    if warmed >= FACTOR_CACHE_SIZE:
+                        return warmed
+                    self._get_factor(version, category, source, target)
+                    warmed += 1
+        except UnitConversionError:
+            # The tables were swapped mid-way; warming them is the next
+            # refresh's job.
+            pass
+        return warmed
+
+    def _compute_factor(
+        self, version: int, category: str, from_unit: str, to_unit: str
+    ) -> Tuple[str, str, float]:
+        # ``version`` is unused here; it only makes the LRU key change on swaps.
+        table = self._tables.get(category)
+        if table is None:
             raise CategoryNotFound(f"Unknown category '{category}'")
-        source = self._resolve_unit(category, from_unit)
-        target = self._resolve_unit(category, to_unit)
-        cache_key = (category, source, target)
-        factor = self._factor_cache.get(cache_key)
+        source = self._resolve_unit(category, table, from_unit)
+        target = self._resolve_unit(category, table, to_unit)
+        factor = table.pairwise.get((source, target))
         if factor is None:
-            factor = self._find_factor(category, source, target)
-            self._factor_cache[cache_key] = factor
-        return ConversionResult(category, source, target, factor, float(value))
-
-    def _resolve_unit(self, category: str, unit: str) -> str:
-        if unit in self._categories[category]:
-            return unit
-        alias_map = self._aliases.get(category, {})
-        resolved = alias_map.get(unit)
-        if not resolved:
+            raise UnitNotFound(
+                f"No conversion path between '{source}' and '{target}' in '{category}'"
+            )
+        return source, target, factor
+
+    @staticmethod
+    def _resolve_unit(category: str, table: CategoryTable, unit: str) -> str:
+        resolved = table.resolver.get(unit)
+        if resolved is None:
             raise UnitNotFound(f"Unknown unit '{unit}' in category '{category}'")
         return resolved
 
-    def _find_factor(self, category: str, source: str, target: str) -> float:
-        if source == target:
-            return 1.0
-        graph = self._graphs[category]
-        visited = set()
-        queue = deque([(source, 1.0)])
+    @staticmethod
+    def _walk_graph(
+        graph: Dict[str, Dict[str, float]], source: str
+    ) -> Dict[str, float]:
+        """Breadth-first factors from ``source`` to every reachable unit."""
+        factors = {source: 1.0}
+        queue = deque([source])
         while queue:
-            unit, acc_factor = queue.popleft()
-            visited.add(unit)
+            unit = queue.popleft()
             for neighbor, edge_factor in graph[unit].items():
-                if neighbor in visited:
-                    continue
-                new_factor = acc_factor * edge_factor
-                if neighbor == target:
-                    return new_factor
-                queue.append((neighbor, new_factor))
-        raise UnitNotFound(
-            f"No conversion path between '{source}' and '{target}' in '{category}'"
-        )
+                if neighbor not in factors:
+                    factors[neighbor] = factors[unit] * edge_factor
+                    queue.append(neighbor)
+        return factors
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import argparse
 from datetime import timedelta
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-from .logic import TimeTracker
+if TYPE_CHECKING:  # pragma: no cover
+    from .logic import TimeTracker
 
 
 def humanize(duration: timedelta) -> str:
@@ -30,21 +31,32 @@ def render_sessions(rows: Iterable[dict]) -> str:
     return "\n".join(lines)
 
 
+def _tracker() -> TimeTracker:
+    """Create the tracker, importing the logic and storage layers on demand.
+
+    Deferring the import keeps ``--help`` and argument errors from loading
+    them (and uuid) at all.
+    """
+    from .logic import TimeTracker
+
+    return TimeTracker()
+
+
 def cmd_start(args: argparse.Namespace) -> str:
-    tracker = TimeTracker()
+    tracker = _tracker()
     session = tracker.start_session(args.category, notes=args.notes or "")
     return f"Started session {session['id']}"
 
 
 def cmd_stop(args: argparse.Namespace) -> str:
-    tracker = TimeTracker()
+    tracker = _tracker()
     session = tracker.stop_session(notes=args.notes)
     duration = tracker.summarize_sessions([session])[0]["duration"]
     return f"Stopped session {session['id']} after {humanize(duration)}"
 
 
 def cmd_list(_: argparse.Namespace) -> str:
-    tracker = TimeTracker()
+    tracker = _tracker()
     sessions = tracker.summarize_sessions(tracker.list_sessions())
     if not sessions:
         return "No sessions recorded."
@@ -52,7 +64,7 @@ def cmd_list(_: argparse.Namespace) -> str:
 
 
 def cmd_report(args: argparse.Namespace) -> str:
-    tracker = TimeTracker()
+    tracker = _tracker()
     report = tracker.report(period=args.period)
     if not report:
         return "No completed sessions to report."
@@ -9,6 +9,7 @@ from __future__ import annotations
 import uuid
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from .storage import SessionStore
@@ -23,12 +24,29 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a stored ISO timestamp, reusing earlier results for the same text.
+
+    Args:
+        value: ISO 8601 timestamp as written by the tracker.
+
+    Returns:
+        datetime: The parsed datetime (immutable, so safe to share).
+    """
+    return datetime.fromisoformat(value)
+
+
 class TimeTracker:
     """High level API for recording work sessions.
 
     Attributes:
         store: The persistence layer for session data.
         _now: Function to get current time (dependency injection for testing).
+        _sessions: Sessions read from the store, loaded on first use and kept
+            in sync by this tracker's own writes.
+        _active_index: Position of the open session in ``_sessions``, if any.
+        _positions: Position of each session in ``_sessions``, keyed by id.
     """
 
     def __init__(
@@ -44,6 +62,40 @@ class TimeTracker:
         """
         self.store = store or SessionStore()
         self._now = now_func
+        self._sessions: Optional[List[Dict[str, Any]]] = None
+        self._active_index: Optional[int] = None
+        self._positions: Dict[str, int] = {}
+
+    def _load(self) -> List[Dict[str, Any]]:
+        """Return the cached sessions, reading the store on first use."""
+        if self._sessions is None:
+            self._read_sessions(self.store.get_active_id())
+        return self._sessions
+
+    def _read_sessions(self, active_id: Optional[str]) -> None:
+        """Load the sessions and locate the open one from the store's marker.
+
+        Args:
+            active_id: The marker as returned by ``SessionStore.get_active_id``.
+        """
+        sessions = self._sessions = self.store.all_sessions()
+        self._positions = {entry.get("id"): i for i, entry in enumerate(sessions)}
+        self._active_index = None
+        if active_id is None:
+            # Older database without a marker: scan once and record the result
+            for index in range(len(sessions) - 1, -1, -1):
+                if sessions[index].get("end") is None:
+                    self._active_index = index
+                    break
+            active = self._active_index
+            self.store.set_active_id(None if active is None else sessions[active]["id"])
+        elif active_id:
+            index = self._positions.get(active_id)
+            if index is not None and sessions[index].get("end") is None:
+                self._active_index = index
+            else:
+                # The marked session is gone or already finished
+                self.store.set_active_id(None)
 
     def start_session(self, category: str, notes: str = "") -> Dict[str, Any]:
         """Start a new work session.
@@ -70,7 +122,13 @@ class TimeTracker:
             "start": self._now().isoformat(),
             "end": None,
         }
-        return self.store.save_session(session)
+        saved = self.store.save_session(session)
+        self.store.set_active_id(saved["id"])
+        if self._sessions is not None:
+            self._positions[saved["id"]] = len(self._sessions)
+            self._active_index = len(self._sessions)
+            self._sessions.append(saved)
+        return saved
 
     def stop_session(self, notes: Optional[str] = None) -> Dict[str, Any]:
         """Stop the currently active session.
@@ -98,6 +156,9 @@ class TimeTracker:
         if result is None:
             # Should typically not happen if active was just fetched
             raise RuntimeError("Failed to update session.")
+        active.update(updates)
+        self.store.set_active_id(None)
+        self._active_index = None
         return result
 
     def list_sessions(self) -> List[Dict[str, Any]]:
@@ -106,9 +167,7 @@ class TimeTracker:
         Returns:
             List[Dict[str, Any]]: List of session records.
         """
-        sessions = self.store.all_sessions()
-        sessions.sort(key=lambda item: item.get("start", ""))
-        return sessions
+        return sorted(self._load(), key=lambda item: item.get("start", ""))
 
     def get_active_session(self) -> Optional[Dict[str, Any]]:
         """Retrieve the currently active session, if any.
@@ -116,20 +175,23 @@ class TimeTracker:
         Returns:
             Optional[Dict[str, Any]]: The active session record or None.
         """
-        sessions = self.store.all_sessions()
-        # Search from newest to oldest for an open session
-        for entry in reversed(sessions):
-            if entry.get("end") is None:
-                return entry
-        return None
+        if self._sessions is None:
+            active_id = self.store.get_active_id()
+            if active_id == "":
+                # The store's marker says nothing is open; skip loading sessions
+                return None
+            self._read_sessions(active_id)
+        if self._active_index is None:
+            return None
+        return self._sessions[self._active_index]
 
     @staticmethod
     def _duration(session: Dict[str, Any]) -> timedelta:
         """Calculate duration of a finished session."""
         if not session.get("end"):
             return timedelta(0)
-        start = datetime.fromisoformat(session["start"])
-        end = datetime.fromisoformat(session["end"])
+        start = _parse_timestamp(session["start"])
+        end = _parse_timestamp(session["end"])
         return end - start
 
     def report(self, period: str = "daily") -> Dict[str, timedelta]:
@@ -141,12 +203,12 @@ class TimeTracker:
         Returns:
             Dict[str, timedelta]: Mapping of period label to total duration.
         """
-        sessions = [s for s in self.store.all_sessions() if s.get("end")]
+        sessions = [s for s in self._load() if s.get("end")]
         buckets: Dict[str, timedelta] = defaultdict(timedelta)
         for session in sessions:
             # Parse start time
             # Note: This assumes ISO format strings are valid
-            start = datetime.fromisoformat(session["start"])
+            start = _parse_timestamp(session["start"])
             if start.tzinfo is None:
                 # Assume UTC if naive, though typically we store ISO with TZ or UTC
                 start = start.replace(tzinfo=timezone.utc)
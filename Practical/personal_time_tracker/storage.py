@@ -28,9 +28,12 @@ class SessionStore:
             path: Path to the JSON database file. Defaults to `~/.personal_time_tracker/sessions.json`.
         """
         self.path = Path(path) if path else Path(DEFAULT_DB_PATH)
+        # Sidecar holding the id of the open session ("" when none is open)
+        self.active_path = self.path.with_name(self.path.name + ".active")
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if not self.path.exists():
             self._write([])
+            self.set_active_id(None)
 
     def _read(self) -> List[Dict[str, Any]]:
         """Read sessions from the JSON file.
@@ -106,6 +109,28 @@ class SessionStore:
         self._write(sessions)
         return target
 
+    def get_active_id(self) -> Optional[str]:
+        """Read the id of the open session without loading the sessions.
+
+        Returns:
+            Optional[str]: The open session's id, ``""`` if no session is
+            open, or None if the marker is missing (e.g. a database created
+            before the marker existed).
+        """
+        try:
+            return self.active_path.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+
+    def set_active_id(self, session_id: Optional[str]) -> None:
+        """Record which session is open.
+
+        Args:
+            session_id: The open session's id, or None when none is open.
+        """
+        self.active_path.write_text(session_id or "", encoding="utf-8")
+
     def delete_all(self) -> None:
         """Delete all sessions (clear database)."""
         self._write([])
+        self.set_active_id(None)
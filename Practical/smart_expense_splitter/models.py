@@ -7,9 +7,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
 MONEY_CONTEXT = Decimal("0.01")
+CENTS_PER_UNIT = 100
+# Ledgers at least this long are accumulated with NumPy when it is installed.
+VECTORIZE_THRESHOLD = 1000
 
 
 def quantize_money(value: Decimal) -> Decimal:
@@ -24,6 +32,30 @@ def quantize_money(value: Decimal) -> Decimal:
     return value.quantize(MONEY_CONTEXT, rounding=ROUND_HALF_UP)
 
 
+def to_cents(value: Decimal) -> int:
+    """Convert a decimal amount to whole cents, rounding half up.
+
+    Args:
+        value: The decimal amount.
+
+    Returns:
+        int: Amount in cents.
+    """
+    return int((value * CENTS_PER_UNIT).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert whole cents back to a two-place decimal.
+
+    Args:
+        cents: Amount in cents.
+
+    Returns:
+        Decimal: Amount with exactly two decimal places.
+    """
+    return Decimal(cents).scaleb(-2)
+
+
 @dataclass(frozen=True)
 class Participant:
     """Person participating in expenses.
@@ -48,18 +80,21 @@ class Expense:
         amount: Total cost.
         payer: Who paid.
         consumers: Who benefited/should share the cost.
+        amount_cents: Total cost in whole cents, derived from ``amount``.
     """
 
     description: str
     amount: Decimal
     payer: Participant
     consumers: List[Participant] = field(default_factory=list)
+    amount_cents: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.amount <= 0:
             raise ValueError("Expense amount must be positive")
         if not self.consumers:
             raise ValueError("Expense must have at least one consumer")
+        object.__setattr__(self, "amount_cents", to_cents(self.amount))
 
     @property
     def split_amount(self) -> Decimal:
@@ -71,6 +106,21 @@ class Expense:
         share = self.amount / Decimal(len(self.consumers))
         return quantize_money(share)
 
+    def split_cents(self) -> List[int]:
+        """Split the amount into per-consumer shares in cents.
+
+        Leftover cents go to the first consumers, so the shares always add
+        up to ``amount_cents`` exactly.
+
+        Returns:
+            List[int]: Share for each consumer, in consumer order.
+        """
+        base, remainder = divmod(self.amount_cents, len(self.consumers))
+        return [
+            base + 1 if index < remainder else base
+            for index in range(len(self.consumers))
+        ]
+
 
 @dataclass(frozen=True)
 class PaymentPlanEntry:
@@ -99,17 +149,23 @@ class PaymentPlanEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DebtGraph:
-    """Directed graph storing balances between participants.
+    """Net balances stored as parallel arrays indexed by participant.
+
+    Participants are numbered in the order they first appear in the
+    expenses, so settlement code can work on integer indices and only look
+    names up when it emits a payment.
 
     Attributes:
-        balances: Mapping of participant name to their net balance.
-                  Positive balance = is owed money (creditor).
-                  Negative balance = owes money (debtor).
+        names: Participant name for each index.
+        values: Net balance in cents for each index.
+                Positive balance = is owed money (creditor).
+                Negative balance = owes money (debtor).
     """
 
-    balances: Dict[str, Decimal]
+    names: List[str]
+    values: List[int]
 
     @classmethod
     def from_expenses(cls, expenses: Iterable[Expense]) -> "DebtGraph":
@@ -121,32 +177,83 @@ class DebtGraph:
         Returns:
             DebtGraph: The calculated debt graph.
         """
-        balances: Dict[str, Decimal] = {}
-        for expense in expenses:
-            share = expense.split_amount
-            payer_key = expense.payer.name
-
-            # Payer gets credit for the full amount paid
-            balances[payer_key] = balances.get(payer_key, Decimal("0")) + expense.amount
+        expenses = list(expenses)
+        if np is not None and len(expenses) >= VECTORIZE_THRESHOLD:
+            return cls(*_accumulate_balances_numpy(expenses))
+        return cls(*_accumulate_balances(expenses))
 
-            # Consumers incur debt for their share
-            for consumer in expense.consumers:
-                key = consumer.name
-                balances[key] = balances.get(key, Decimal("0")) - share
-        return cls(balances)
+    @property
+    def balances(self) -> Dict[str, int]:
+        """Mapping of participant name to net balance in cents."""
+        return dict(zip(self.names, self.values))
 
-    def creditors(self) -> Dict[str, Decimal]:
+    def creditors(self) -> List[int]:
         """Get participants who are owed money.
 
         Returns:
-            Dict[str, Decimal]: Map of name to positive balance.
+            List[int]: Indices of participants with a positive balance.
         """
-        return {name: bal for name, bal in self.balances.items() if bal > Decimal("0")}
+        return [position for position, bal in enumerate(self.values) if bal > 0]
 
-    def debtors(self) -> Dict[str, Decimal]:
+    def debtors(self) -> List[int]:
         """Get participants who owe money.
 
         Returns:
-            Dict[str, Decimal]: Map of name to negative balance.
+            List[int]: Indices of participants with a negative balance.
         """
-        return {name: bal for name, bal in self.balances.items() if bal < Decimal("0")}
+        return [position for position, bal in enumerate(self.values) if bal < 0]
+
+
+def _accumulate_balances(expenses: Iterable[Expense]) -> Tuple[List[str], List[int]]:
+    """Sum net balances in cents with a plain Python loop."""
+    index: Dict[str, int] = {}
+    values: List[int] = []
+
+    def slot(name: str) -> int:
+        position = index.get(name)
+        if position is None:
+            position = index[name] = len(values)
+            values.append(0)
+        return position
+
+    for expense in expenses:
+        # Payer gets credit for the full amount paid
+        values[slot(expense.payer.name)] += expense.amount_cents
+
+        # Consumers incur debt for their share
+        for consumer, share in zip(expense.consumers, expense.split_cents()):
+            values[slot(consumer.name)] -= share
+    return list(index), values
+
+
+def _accumulate_balances_numpy(
+    expenses: Sequence[Expense],
+) -> Tuple[List[str], List[int]]:
+    """Sum net balances in cents with NumPy scatter-adds.
+
+    Names are indexed in the same order the Python loop would number them,
+    so both paths return identical arrays.
+    """
+    name_to_idx: Dict[str, int] = {}
+    payer_idx = np.empty(len(expenses), dtype=np.int64)
+    amounts = np.empty(len(expenses), dtype=np.int64)
+    counts = np.empty(len(expenses), dtype=np.int64)
+    consumer_idx: List[int] = []
+    for row, expense in enumerate(expenses):
+        payer_idx[row] = name_to_idx.setdefault(expense.payer.name, len(name_to_idx))
+        amounts[row] = expense.amount_cents
+        counts[row] = len(expense.consumers)
+        for consumer in expense.consumers:
+            consumer_idx.append(name_to_idx.setdefault(consumer.name, len(name_to_idx)))
+
+    # Same split as Expense.split_cents: the first ``remainder`` consumers of
+    # each expense pay one extra cent.
+    base, remainder = np.divmod(amounts, counts)
+    offsets = np.cumsum(counts) - counts
+    position = np.arange(len(consumer_idx)) - np.repeat(offsets, counts)
+    shares = np.repeat(base, counts) + (position < np.repeat(remainder, counts))
+
+    balances = np.zeros(len(name_to_idx), dtype=np.int64)
+    np.add.at(balances, payer_idx, amounts)
+    np.subtract.at(balances, np.asarray(consumer_idx, dtype=np.int64), shares)
+    return list(name_to_idx), balances.tolist()
@@ -5,13 +5,30 @@ Handlers for parsing expense data from various input formats (text strings, file
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import csv
+import functools
+import re
+from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Union
 
 from .models import Expense, Participant
 
+# Names and amounts recur across many rows of a ledger, so parsed values are
+# interned instead of being rebuilt for every expense.
+_INTERN_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_INTERN_CACHE_SIZE)
+def _intern_participant(name: str) -> Participant:
+    return Participant(name)
+
+
+@functools.lru_cache(maxsize=_INTERN_CACHE_SIZE)
+def _to_decimal(raw: str) -> Decimal:
+    return Decimal(raw)
+
 
 @dataclass
 class ExpenseInputParser:
@@ -24,6 +41,16 @@ class ExpenseInputParser:
 
     delimiter: str = ";"
     consumer_delimiter: str = ","
+    _field_splitter: re.Pattern = field(init=False, repr=False, compare=False)
+    _consumer_splitter: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Splitting on the delimiter together with its surrounding whitespace
+        # yields already-stripped fields in a single C-level pass.
+        self._field_splitter = re.compile(rf"\s*{re.escape(self.delimiter)}\s*")
+        self._consumer_splitter = re.compile(
+            rf"\s*{re.escape(self.consumer_delimiter)}\s*"
+        )
 
     def parse(self, raw: str) -> Expense:
         """Parse a single line into an Expense object.
@@ -37,18 +64,21 @@ class ExpenseInputParser:
         Raises:
             ValueError: If the input format is invalid.
         """
-        parts = [part.strip() for part in raw.split(self.delimiter)]
+        return self._build_expense(self._field_splitter.split(raw.strip()))
+
+    def _build_expense(self, parts: Sequence[str]) -> Expense:
+        """Validate already split and stripped fields and build an Expense."""
         if len(parts) != 4:
             raise ValueError(
                 "Expense input must contain description, amount, payer and consumers separated by ';'"
             )
         description, amount_raw, payer_name, consumers_raw = parts
-        amount = Decimal(amount_raw)
-        payer = Participant(payer_name)
+        amount = _to_decimal(amount_raw)
+        payer = _intern_participant(payer_name)
         consumers = [
-            Participant(name.strip())
-            for name in consumers_raw.split(self.consumer_delimiter)
-            if name.strip()
+            _intern_participant(name)
+            for name in self._consumer_splitter.split(consumers_raw)
+            if name
         ]
         if not consumers:
             raise ValueError("Expense must include at least one consumer")
@@ -59,13 +89,24 @@ class ExpenseInputParser:
     def parse_many(self, rows: Iterable[str]) -> List[Expense]:
         """Parse multiple expense strings.
 
+        Rows are consumed lazily, so an open file handle can be passed
+        directly. Single-character delimiters are tokenised by the C
+        ``csv`` reader (with quoting disabled, so quotes stay literal).
+
         Args:
             rows: Iterable of strings.
 
         Returns:
             List[Expense]: List of parsed Expense objects.
         """
-        return [self.parse(row) for row in rows if row.strip()]
+        if len(self.delimiter) != 1:
+            return [self.parse(row) for row in rows if row.strip()]
+        reader = csv.reader(rows, delimiter=self.delimiter, quoting=csv.QUOTE_NONE)
+        return [
+            self._build_expense([part.strip() for part in fields])
+            for fields in reader
+            if len(fields) > 1 or (fields and fields[0].strip())
+        ]
 
 
 def load_expenses_from_file(
@@ -88,7 +129,7 @@ def load_expenses_from_file(
     if not file_path.exists():
         raise FileNotFoundError(file_path)
     with file_path.open("r", encoding="utf-8") as handle:
-        return parser.parse_many(handle.readlines())
+        return parser.parse_many(handle)
 
 
 def parse_cli_expenses(
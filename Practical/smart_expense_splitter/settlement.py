@@ -5,11 +5,18 @@ Provides logic to simplify a web of debts into a concise list of transactions.
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .models import DebtGraph, Expense, Participant, PaymentPlanEntry, quantize_money
+from .models import DebtGraph, Expense, Participant, PaymentPlanEntry, from_cents
+
+# Searching for two people that cancel a third is O(creditors * debtors), so
+# the pair pass only runs for groups up to this size.
+EXACT_PAIR_LIMIT = 256
+
+Transfer = Tuple[int, int, int]
 
 
 @dataclass
@@ -41,13 +48,17 @@ def build_balance_sheet(expenses: Iterable[Expense]) -> Dict[str, Decimal]:
         Dict[str, Decimal]: Map of name to net balance.
     """
     graph = DebtGraph.from_expenses(expenses)
-    return graph.balances
+    return {name: from_cents(balance) for name, balance in graph.balances.items()}
 
 
 def optimize_settlements(expenses: Iterable[Expense]) -> SettlementPlan:
     """Compute a settlement plan that resolves all debts.
 
-    Uses a greedy algorithm: match the biggest debtor with the biggest creditor.
+    Balances that cancel exactly are settled first: a creditor and a debtor
+    with opposite balances, then one person whose balance is matched by two
+    others combined. The rest is resolved greedily by matching the biggest
+    debtor with the biggest creditor.
+    Both sides are kept in heaps, so each settlement step costs O(log N).
     This minimizes the number of transactions in many cases (though not strictly optimal for all graphs).
 
     Args:
@@ -56,53 +67,121 @@ def optimize_settlements(expenses: Iterable[Expense]) -> SettlementPlan:
     Returns:
         SettlementPlan: The list of payments to make.
     """
+    # Balances are integer cents, so the arithmetic below is exact. The loop
+    # works on participant indices and only looks names up for each payment.
     graph = DebtGraph.from_expenses(expenses)
+    names = graph.names
+    values = list(graph.values)
+    entries: List[PaymentPlanEntry] = []
 
-    # Ensure money is quantized before processing to avoid precision artifacts
-    balances = {
-        name: quantize_money(balance) for name, balance in graph.balances.items()
-    }
-
-    # Filter out zero balances
-    creditors = {name: bal for name, bal in balances.items() if bal > 0}
-    debtors = {name: bal for name, bal in balances.items() if bal < 0}
+    def pay(payer: int, receiver: int, amount: int) -> None:
+        entries.append(
+            PaymentPlanEntry(
+                payer=Participant(names[payer]),
+                receiver=Participant(names[receiver]),
+                amount=from_cents(amount),
+            )
+        )
 
-    entries: List[PaymentPlanEntry] = []
+    for payer, receiver, amount in _settle_exact_matches(values):
+        pay(payer, receiver, amount)
 
-    # Greedy settlement loop
-    while creditors and debtors:
-        # Find max creditor and max debtor (most negative)
-        creditor_name = max(creditors, key=creditors.get)  # type: ignore
-        debtor_name = min(debtors, key=debtors.get)  # type: ignore
+    # Max-heap of creditors and min-heap of debtors (balances are negative).
+    # The index breaks ties in first-seen order, like max()/min() did.
+    creditor_heap = [(-bal, position) for position, bal in enumerate(values) if bal > 0]
+    debtor_heap = [(bal, position) for position, bal in enumerate(values) if bal < 0]
+    heapq.heapify(creditor_heap)
+    heapq.heapify(debtor_heap)
 
-        creditor_amount = creditors[creditor_name]
-        debtor_amount = debtors[debtor_name]
+    # Greedy settlement loop: each side has exactly one heap entry per person,
+    # so popping both tops and pushing back any residual keeps the heaps exact.
+    while creditor_heap and debtor_heap:
+        negative_credit, creditor = heapq.heappop(creditor_heap)
+        debtor_amount, debtor = heapq.heappop(debtor_heap)
+        creditor_amount = -negative_credit
 
         # Amount to transfer is the minimum of what one owes and the other is owed
-        settlement_amount = quantize_money(min(creditor_amount, -debtor_amount))
+        settlement_amount = min(creditor_amount, -debtor_amount)
+        pay(debtor, creditor, settlement_amount)
 
-        if settlement_amount == 0:
-            break
+        # Update balances and requeue anyone who is not fully settled
+        new_creditor_bal = creditor_amount - settlement_amount
+        new_debtor_bal = debtor_amount + settlement_amount
 
-        entries.append(
-            PaymentPlanEntry(
-                payer=Participant(debtor_name),
-                receiver=Participant(creditor_name),
-                amount=settlement_amount,
-            )
-        )
+        if new_creditor_bal != 0:
+            heapq.heappush(creditor_heap, (-new_creditor_bal, creditor))
+        if new_debtor_bal != 0:
+            heapq.heappush(debtor_heap, (new_debtor_bal, debtor))
 
-        # Update balances
-        new_creditor_bal = quantize_money(creditor_amount - settlement_amount)
-        new_debtor_bal = quantize_money(debtor_amount + settlement_amount)
+    return SettlementPlan(entries)
 
-        creditors[creditor_name] = new_creditor_bal
-        debtors[debtor_name] = new_debtor_bal
 
-        # Remove settled participants
-        if creditors[creditor_name] == 0:
-            del creditors[creditor_name]
-        if debtors[debtor_name] == 0:
-            del debtors[debtor_name]
+def _settle_exact_matches(values: List[int]) -> List[Transfer]:
+    """Settle groups of two or three people whose balances cancel exactly.
 
-    return SettlementPlan(entries)
+    Settled participants have their balance set to zero in place.
+
+    Args:
+        values: Net balance in cents for each participant index.
+
+    Returns:
+        List[Transfer]: ``(payer, receiver, cents)`` transfers by index.
+    """
+    transfers: List[Transfer] = []
+    _match_targets(values, 1, transfers, allow_pairs=False)
+    if len(values) <= EXACT_PAIR_LIMIT:
+        _match_targets(values, 1, transfers, allow_pairs=True)
+        _match_targets(values, -1, transfers, allow_pairs=True)
+    return transfers
+
+
+def _match_targets(
+    values: List[int],
+    target_sign: int,
+    transfers: List[Transfer],
+    allow_pairs: bool,
+) -> None:
+    """Cancel each target (balance of ``target_sign``) with one or two sources.
+
+    Sources are participants on the opposite side whose balance magnitude
+    equals the target's, alone or combined with one other source.
+    """
+    sources: Dict[int, List[int]] = {}
+    for position, balance in enumerate(values):
+        if balance * target_sign < 0:
+            sources.setdefault(-balance * target_sign, []).append(position)
+
+    def take(amount: int, exclude: Optional[int] = None) -> Optional[int]:
+        candidates = sources.get(amount, [])
+        for offset, position in enumerate(candidates):
+            if position != exclude:
+                return candidates.pop(offset)
+        return None
+
+    for target, balance in enumerate(values):
+        amount = balance * target_sign
+        if amount <= 0:
+            continue
+        matched = [take(amount)]
+        if matched[0] is None and allow_pairs:
+            matched = []
+            for first_amount, candidates in sources.items():
+                rest = amount - first_amount
+                if not candidates or rest <= 0 or not sources.get(rest):
+                    continue
+                first = candidates[0]
+                second = take(rest, exclude=first)
+                if second is not None:
+                    sources[first_amount].remove(first)
+                    matched = [first, second]
+                    break
+        for source in matched:
+            if source is None:
+                continue
+            paid = -values[source] * target_sign
+            if target_sign > 0:
+                transfers.append((source, target, paid))
+            else:
+                transfers.append((target, source, paid))
+            values[source] = 0
+            values[target] -= paid * target_sign
@@ -6,6 +6,7 @@ Entry point for generating static sites.
 from __future__ import annotations
 
 import argparse
+import logging
 from pathlib import Path
 
 try:
@@ -28,11 +29,25 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument(
         "--base-url", default="/", help="Base URL for the site (default: /)"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rebuild pages whose sources changed since the last build",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Log every generated page"
+    )
 
     args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
 
     try:
-        generator = SiteGenerator(args.input, args.output, args.base_url)
+        generator = SiteGenerator(
+            args.input, args.output, args.base_url, incremental=args.incremental
+        )
         generator.build()
         print(f"Site generated successfully at {args.output}")
     except Exception as e:
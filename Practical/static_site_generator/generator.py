@@ -1,80 +1,438 @@
 """Core logic for the Static Site Generator."""
 
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 import markdown
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as CmarkOptions
+except ImportError:  # pragma: no cover - optional fast path
+    cmarkgfm = None
+
+try:
+    import yaml
+
+    YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:  # pragma: no cover - optional YAML front matter
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+GFM_EXTENSIONS = ["table", "strikethrough", "autolink"]
+
+# Below this many pages, process start-up costs more than parallel parsing saves.
+PARALLEL_PARSE_THRESHOLD = 8
+PARSE_CHUNKSIZE = 8
+READ_WORKERS = 32
+WRITE_WORKERS = 16
+COPY_WORKERS = 16
+# Source mtimes from the last incremental build, kept in the output directory.
+CACHE_FILENAME = ".build_cache.json"
+CACHE_VERSION = 1
+# O_BINARY only exists (and only matters) on Windows.
+READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _iter_markdown(root: str | os.PathLike[str]) -> Iterator[str]:
+    """Yield every ``.md`` file below ``root``.
+
+    ``DirEntry`` caches the file type from the directory listing, so no
+    extra ``stat`` call is needed per entry.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_markdown(entry.path)
+            elif entry.name.endswith(".md"):
+                yield entry.path
+
+
+def _tree_mtimes(root: str) -> dict[str, int]:
+    """Map every file below ``root`` (relative path) to its mtime in ns."""
+    prefix = os.path.join(root, "")
+    mtimes = {}
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(entry.path)
+                else:
+                    mtimes[entry.path[len(prefix) :]] = entry.stat().st_mtime_ns
+    return mtimes
+
+
+def _read_source(file_path: str) -> str:
+    """Read a whole source file with raw syscalls and decode it in one pass."""
+    fd = os.open(file_path, READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        while chunk := os.read(fd, max(size, 1)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    # Normalise newlines like text-mode open() did, so "---\r\n" front
+    # matter is still recognised.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _fastcopy(src: str, dst: str) -> None:
+    """Copy file contents without bouncing them through Python buffers.
+
+    Tries ``copy_file_range`` (a reflink on filesystems that support it),
+    then ``sendfile``, and finally falls back to ``shutil.copyfileobj``.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(infd).st_size
+        copied = 0
+        for kernel_copy in (_copy_file_range, _sendfile):
+            try:
+                while copied < size:
+                    sent = kernel_copy(infd, outfd, copied, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except (AttributeError, OSError):
+                pass
+            if copied >= size:
+                return
+        fsrc.seek(copied)
+        fdst.seek(copied)
+        shutil.copyfileobj(fsrc, fdst)
+
+
+def _copy_file_range(infd: int, outfd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(infd, outfd, count, offset, offset)
+
+
+def _sendfile(infd: int, outfd: int, offset: int, count: int) -> int:
+    os.lseek(outfd, offset, os.SEEK_SET)
+    return os.sendfile(outfd, infd, offset, count)
+
+
+def _stream_page(template: Template, output_path: str, context: dict) -> None:
+    """Render ``template`` straight into ``output_path`` as UTF-8 bytes.
+
+    Output is written block by block, so a page is never held in memory
+    as a single string. A partially written page is removed on failure.
+    """
+    try:
+        with open(output_path, "wb") as handle:
+            template.stream(context).dump(handle, encoding="utf-8")
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(output_path)
+        raise
+
+
+def _parse_markdown(content: str) -> tuple[dict, str]:
+    """Split front matter from a Markdown source and render its body.
+
+    Kept at module level so it can be shipped to worker processes.
+    """
+    meta = {}
+    body = content
+    if content.startswith("---\n"):
+        end = content.find("\n---\n", 3)
+        if end != -1:
+            meta = _parse_front_matter(content[4:end])
+            body = content[end + 5 :]
+
+    return meta, _markdown_to_html(body)
+
+
+def _parse_front_matter(text: str) -> dict:
+    """Parse front matter as YAML, falling back to plain ``key: value`` lines.
+
+    The fallback also covers front matter that is not valid YAML, such as
+    an unquoted title containing ``: ``.
+    """
+    if yaml is not None:
+        try:
+            meta = yaml.load(text, Loader=YamlLoader)
+        except yaml.YAMLError:
+            pass
+        else:
+            if meta is None:
+                return {}
+            if isinstance(meta, dict):
+                return meta
+
+    meta = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            meta[key.strip()] = value.strip()
+    return meta
+
+
+def _markdown_to_html(body: str) -> str:
+    """Convert Markdown with cmark-gfm's C parser when it is installed.
+
+    Raw HTML is passed through (``CMARK_OPT_UNSAFE``) to match the pure
+    Python ``markdown`` fallback.
+    """
+    if cmarkgfm is not None:
+        return cmarkgfm.markdown_to_html_with_extensions(
+            body, options=CmarkOptions.CMARK_OPT_UNSAFE, extensions=GFM_EXTENSIONS
+        )
+    converter = _get_markdown()
+    converter.reset()
+    return converter.convert(body)
+
+
+_markdown: markdown.Markdown | None = None
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Return this process's Markdown converter, building it on first use.
+
+    Each pool worker builds its own the first time it parses a page, rather
+    than once per page as ``markdown.markdown`` does.
+    """
+    global _markdown
+    if _markdown is None:
+        _markdown = markdown.Markdown()
+    return _markdown
 
 
 class SiteGenerator:
-    def __init__(self, input_dir: Path, output_dir: Path, base_url: str = "/"):
+    def __init__(
+        self,
+        input_dir: Path,
+        output_dir: Path,
+        base_url: str = "/",
+        incremental: bool = False,
+    ):
         self.input_dir = input_dir
         self.output_dir = output_dir
         self.base_url = base_url
+        # Reuse outputs whose sources are unchanged since the last build.
+        self.incremental = incremental
+        self.cache_path = output_dir / CACHE_FILENAME
         self.content_dir = input_dir / "content"
         self.templates_dir = input_dir / "templates"
         self.static_dir = input_dir / "static"
+        # Source paths are joined onto exactly os.fspath(content_dir).
+        self._content_prefix = os.path.join(os.fspath(self.content_dir), "")
+        self._output_prefix = os.path.join(os.fspath(self.output_dir), "")
 
         if not self.templates_dir.exists():
             raise FileNotFoundError(
                 f"Templates directory not found: {self.templates_dir}"
             )
 
+        # Templates cannot change during a build, so skip Jinja's per-lookup
+        # mtime check and never evict compiled templates. Trimming whitespace
+        # around block tags leaves fewer output nodes to render.
         self.env = Environment(
             loader=FileSystemLoader(self.templates_dir),
             autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=False,
+            cache_size=-1,
+            trim_blocks=True,
+            lstrip_blocks=True,
         )
+        self._templates: dict[str, Template] = {}
+
+    def _get_template(self, name: str) -> Template:
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.env.get_template(name)
+        return template
 
     def build(self):
-        # Clean output
-        if self.output_dir.exists():
-            shutil.rmtree(self.output_dir)
-        self.output_dir.mkdir(parents=True)
+        # Templates are cached for the duration of one build only.
+        self._templates.clear()
+        self.env.cache.clear()
+
+        previous = self._load_cache() if self.incremental else None
+        if previous is None:
+            # Clean output
+            if self.output_dir.exists():
+                shutil.rmtree(self.output_dir)
+            self.output_dir.mkdir(parents=True)
 
         # Copy static
         if self.static_dir.exists():
-            shutil.copytree(self.static_dir, self.output_dir / "static")
+            self.copy_static()
 
         # Process content
         if not self.content_dir.exists():
-            print(f"Warning: Content directory not found: {self.content_dir}")
+            logger.warning("Content directory not found: %s", self.content_dir)
             return
 
-        for root, _, files in os.walk(self.content_dir):
-            for file in files:
-                if file.endswith(".md"):
-                    self._process_file(Path(root) / file)
-
-    def _process_file(self, file_path: Path):
-        rel_path = file_path.relative_to(self.content_dir)
-        output_path = self.output_dir / rel_path.with_suffix(".html")
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        content = file_path.read_text(encoding="utf-8")
-
-        # Simple frontmatter parsing
-        meta = {}
-        body = content
-        if content.startswith("---\n"):
-            parts = content.split("---\n", 2)
-            if len(parts) >= 3:
-                frontmatter = parts[1]
-                body = parts[2]
-                for line in frontmatter.splitlines():
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        meta[key.strip()] = value.strip()
-
-        html_content = markdown.markdown(body)
-
-        template_name = meta.get("template", "base.html")
-        try:
-            template = self.env.get_template(template_name)
-            render = template.render(
-                content=html_content, meta=meta, base_url=self.base_url
+        md_files = list(_iter_markdown(self.content_dir))
+        total = len(md_files)
+        if self.incremental:
+            mtimes = {path: os.stat(path).st_mtime_ns for path in md_files}
+            template_mtimes = _tree_mtimes(os.fspath(self.templates_dir))
+            if previous is not None:
+                md_files = self._stale_sources(previous, mtimes, template_mtimes)
+        # Reads are I/O-bound, so overlap them with threads before parsing.
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+            sources = list(pool.map(_read_source, md_files))
+
+        # Markdown conversion is CPU-bound pure Python, so spread it across
+        # processes; rendering and writing stay in this process.
+        if len(sources) >= PARALLEL_PARSE_THRESHOLD:
+            with ProcessPoolExecutor() as pool:
+                parsed = list(
+                    pool.map(_parse_markdown, sources, chunksize=PARSE_CHUNKSIZE)
+                )
+        else:
+            parsed = [_parse_markdown(source) for source in sources]
+
+        # Group pages by output directory so each directory is created once.
+        by_dir: dict[str, list[tuple[str, str, dict[str, str], str]]] = {}
+        for file_path, (meta, html_content) in zip(md_files, parsed):
+            output_path = self._output_path(file_path)
+            by_dir.setdefault(os.path.dirname(output_path), []).append(
+                (file_path, output_path, meta, html_content)
             )
-            output_path.write_text(render, encoding="utf-8")
-        except Exception as e:
-            print(f"Error rendering {file_path}: {e}")
+
+        # Pages are streamed to disk from worker threads so the blocking
+        # writes overlap. Templates are looked up here, keeping the template
+        # cache single-threaded; each page gets its own context because it is
+        # rendered on another thread.
+        failed = set()
+        jobs = []
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+            for directory, group in by_dir.items():
+                os.makedirs(directory, exist_ok=True)
+                for file_path, output_path, meta, html_content in group:
+                    try:
+                        template = self._get_template(meta.get("template", "base.html"))
+                    except Exception as e:
+                        logger.error("Error rendering %s: %s", file_path, e)
+                        failed.add(output_path)
+                        continue
+                    context = {
+                        "base_url": self.base_url,
+                        "content": html_content,
+                        "meta": meta,
+                    }
+                    future = pool.submit(_stream_page, template, output_path, context)
+                    jobs.append((file_path, output_path, future))
+            for file_path, output_path, future in jobs:
+                try:
+                    future.result()
+                except OSError as e:
+                    logger.error("Error writing %s: %s", output_path, e)
+                    failed.add(output_path)
+                except Exception as e:
+                    logger.error("Error rendering %s: %s", file_path, e)
+                    failed.add(output_path)
+                else:
+                    logger.debug("Generated %s", output_path)
+        # One summary line instead of a log record per page.
+        logger.info(
+            "Generated %d pages (%d unchanged, %d failed)",
+            len(md_files) - len(failed),
+            total - len(md_files),
+            len(failed),
+        )
+
+        if self.incremental:
+            # Failed pages are left out so the next build retries them.
+            self._save_cache(
+                {
+                    path[len(self._content_prefix) :]: mtime
+                    for path, mtime in mtimes.items()
+                    if self._output_path(path) not in failed
+                },
+                template_mtimes,
+            )
+
+    def _load_cache(self) -> dict | None:
+        try:
+            with open(self.cache_path, encoding="utf-8") as handle:
+                cache = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+            return None
+        return cache
+
+    def _save_cache(self, sources: dict[str, int], templates: dict[str, int]) -> None:
+        cache = {
+            "version": CACHE_VERSION,
+            "base_url": self.base_url,
+            "templates": templates,
+            "sources": sources,
+        }
+        with open(self.cache_path, "w", encoding="utf-8") as handle:
+            json.dump(cache, handle)
+
+    def _stale_sources(
+        self,
+        previous: dict,
+        mtimes: dict[str, int],
+        template_mtimes: dict[str, int],
+    ) -> list[str]:
+        """Return the sources that need rebuilding and drop orphaned pages.
+
+        Every page is stale when a template or the base URL changed, since
+        either can alter any rendered page.
+        """
+        previous_sources = previous.get("sources", {})
+        current = {path[len(self._content_prefix) :] for path in mtimes}
+        for rel_path in previous_sources.keys() - current:
+            try:
+                os.remove(self._output_path(self._content_prefix + rel_path))
+            except FileNotFoundError:
+                pass
+
+        if (
+            previous.get("templates") != template_mtimes
+            or previous.get("base_url") != self.base_url
+        ):
+            return list(mtimes)
+        return [
+            path
+            for path, mtime in mtimes.items()
+            if previous_sources.get(path[len(self._content_prefix) :]) != mtime
+            or not os.path.exists(self._output_path(path))
+        ]
+
+    def copy_static(self):
+        """Mirror the static directory into the output with kernel-side copies."""
+        copies = []
+        pending = [(str(self.static_dir), str(self.output_dir / "static"))]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            os.makedirs(dst_dir, exist_ok=True)
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    dst = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        pending.append((entry.path, dst))
+                    else:
+                        copies.append((entry.path, dst))
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            for future in [pool.submit(_fastcopy, src, dst) for src, dst in copies]:
+                future.result()
+
+    def _output_path(self, file_path: str) -> str:
+        # Every source path starts with the content prefix, so slicing is
+        # enough to map it to its output path.
+        rel_path = file_path[len(self._content_prefix) :]
+        return self._output_prefix + rel_path[: -len(".md")] + ".html"
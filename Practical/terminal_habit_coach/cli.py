@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from contextlib import closing
 from pathlib import Path
 from typing import List, Optional
 
@@ -76,31 +77,32 @@ def main(argv: Optional[List[str]] = None) -> int:
     args = parser.parse_args(argv)
 
     coach = _build_coach(args.database)
-
-    if args.command == "add-habit":
-        coach.add_habit(args.name, args.description, args.frequency, args.reminder)
-        print(f"Added habit '{args.name}'.")
-        return 0
-    if args.command == "log":
-        coach.log(args.name, when=args.when, note=args.note)
-        print(f"Logged progress for '{args.name}'.")
-        return 0
-    if args.command == "status":
-        for line in coach.list_status():
-            print(line)
-        return 0
-    if args.command == "streaks":
-        for line in coach.render_streaks():
-            print(line)
-        return 0
-    if args.command == "show":
-        try:
-            for line in coach.habit_summary(args.name):
+    # The whole command runs on the repository's single connection.
+    with closing(coach.repo):
+        if args.command == "add-habit":
+            coach.add_habit(args.name, args.description, args.frequency, args.reminder)
+            print(f"Added habit '{args.name}'.")
+            return 0
+        if args.command == "log":
+            coach.log(args.name, when=args.when, note=args.note)
+            print(f"Logged progress for '{args.name}'.")
+            return 0
+        if args.command == "status":
+            for line in coach.list_status():
+                print(line)
+            return 0
+        if args.command == "streaks":
+            for line in coach.render_streaks():
                 print(line)
-        except ValueError as e:
-            print(f"Error: {e}")
-            return 1
-        return 0
+            return 0
+        if args.command == "show":
+            try:
+                for line in coach.habit_summary(args.name):
+                    print(line)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return 1
+            return 0
 
     parser.error("Unknown command")
     return 1
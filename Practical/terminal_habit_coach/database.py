@@ -8,11 +8,37 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 from datetime import date, datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 DEFAULT_DB_PATH = Path.home() / ".terminal_habit_coach.db"
 
+# Seconds to wait for another writer's lock before failing (busy_timeout).
+BUSY_TIMEOUT_SECONDS = 5.0
+# WAL commits only need an fsync at checkpoints with synchronous=NORMAL; a
+# 64 MiB page cache, in-memory temp tables and mmap'd reads keep queries off
+# the read() path.
+CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 2147483648;
+"""
+
 
 @dataclass
 class Habit:
@@ -33,9 +59,145 @@ class Habit:
     reminder_time: Optional[str]
 
 
+# Whole days from the last logged date to :today, and the same as display text.
+_DAYS_SINCE = "CAST(julianday(:today) - julianday(s.last_logged_date) AS INTEGER)"
+_STATS_COLUMNS = f"""
+    h.*, s.last_logged_date,
+    COALESCE(s.current_streak, 0) AS current_streak,
+    COALESCE(s.longest_streak, 0) AS longest_streak,
+    {_DAYS_SINCE} AS days_since,
+    CASE
+        WHEN s.last_logged_date IS NULL THEN 'never'
+        WHEN {_DAYS_SINCE} = 0 THEN 'today'
+        ELSE printf('%d day(s) ago', {_DAYS_SINCE})
+    END AS freshness
+"""
+
+# Habit columns plus streak metadata and log aggregates for one habit.
+_HABIT_STATS_QUERY = f"""
+    SELECT {_STATS_COLUMNS},
+           COUNT(l.id) AS total, MAX(l.logged_at) AS last_logged
+    FROM habits h
+    LEFT JOIN streak_metadata s ON h.id = s.habit_id
+    LEFT JOIN log_entries l ON h.id = l.habit_id
+    WHERE h.name = :name
+    GROUP BY h.id
+"""
+
+# The same columns for every habit. Logs are aggregated per habit in one pass
+# over the log index before the join, so the join sees one row per habit.
+_ALL_STATS_QUERY = f"""
+    SELECT {_STATS_COLUMNS},
+           COALESCE(l.total, 0) AS total, l.last_logged
+    FROM habits h
+    LEFT JOIN streak_metadata s ON h.id = s.habit_id
+    LEFT JOIN (
+        SELECT habit_id, COUNT(*) AS total, MAX(logged_at) AS last_logged
+        FROM log_entries
+        GROUP BY habit_id
+    ) l ON h.id = l.habit_id
+    ORDER BY h.name
+"""
+
+# One presentation-ready status table row per habit, formatted by SQLite. The
+# layout matches service.STATUS_ROW; the "!" flag pads by characters rather
+# than bytes so non-ASCII names line up.
+_STATUS_ROWS_QUERY = """
+    SELECT printf(
+               '%!-20s %8d %8d %6d %!20s',
+               h.name,
+               COALESCE(s.current_streak, 0),
+               COALESCE(s.longest_streak, 0),
+               COALESCE(l.total, 0),
+               COALESCE(l.last_logged, '—')
+           )
+    FROM habits h
+    LEFT JOIN streak_metadata s ON h.id = s.habit_id
+    LEFT JOIN (
+        SELECT habit_id, COUNT(*) AS total, MAX(logged_at) AS last_logged
+        FROM log_entries
+        GROUP BY habit_id
+    ) l ON h.id = l.habit_id
+    ORDER BY h.name
+"""
+
+# Advances a habit's streak for a log on excluded.last_logged_date: a log on
+# the same day keeps the streak, the next day extends it and any other day
+# restarts it at 1. Every SET expression sees the row's old values.
+_NEXT_STREAK = """
+    CASE julianday(excluded.last_logged_date) - julianday(last_logged_date)
+        WHEN 0 THEN current_streak
+        WHEN 1 THEN current_streak + 1
+        ELSE 1
+    END
+"""
+_STREAK_UPSERT = f"""
+    INSERT INTO streak_metadata(habit_id, last_logged_date, current_streak, longest_streak)
+    SELECT id, ?, 1, 1 FROM habits WHERE name = ?
+    ON CONFLICT(habit_id) DO UPDATE SET
+        current_streak = {_NEXT_STREAK},
+        longest_streak = MAX(longest_streak, {_NEXT_STREAK}),
+        last_logged_date = excluded.last_logged_date
+"""
+
+# Streaks rebuilt from the full log history of the habits in {ids}: distinct
+# log days are grouped into runs of consecutive days (day number minus row
+# number is constant within a run), then the latest and longest runs are kept.
+_STREAKS_QUERY = """
+    WITH days AS (
+        SELECT DISTINCT habit_id, substr(logged_at, 1, 10) AS day
+        FROM log_entries
+        WHERE habit_id IN ({ids})
+    ),
+    runs AS (
+        SELECT habit_id, MAX(day) AS last_day, COUNT(*) AS length
+        FROM (
+            SELECT habit_id, day,
+                   julianday(day)
+                   - ROW_NUMBER() OVER (PARTITION BY habit_id ORDER BY day) AS run
+            FROM days
+        )
+        GROUP BY habit_id, run
+    )
+    SELECT habit_id, MAX(last_day) AS last_day, MAX(length) AS longest,
+           (SELECT length FROM runs latest
+            WHERE latest.habit_id = runs.habit_id
+            ORDER BY latest.last_day DESC LIMIT 1) AS current
+    FROM runs
+    GROUP BY habit_id
+"""
+
+
+def _habit_from_row(row: sqlite3.Row) -> Habit:
+    """Build a Habit from a row containing the habits columns."""
+    return Habit(
+        id=row["id"],
+        name=row["name"],
+        description=row["description"],
+        frequency=row["frequency"],
+        reminder_time=row["reminder_time"],
+    )
+
+
+def _stats_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Build a stats dict from a row of one of the stats queries."""
+    return {
+        "habit": _habit_from_row(row),
+        "total_logs": row["total"],
+        "last_logged": row["last_logged"],
+        "current_streak": row["current_streak"],
+        "longest_streak": row["longest_streak"],
+        "days_since_log": row["days_since"],
+        "freshness": row["freshness"],
+    }
+
+
 class HabitRepository:
     """Data-access layer that encapsulates SQLite operations."""
 
+    # Database files whose schema this process has already provisioned.
+    _schema_ready: ClassVar[Set[Path]] = set()
+
     def __init__(self, db_path: Optional[Union[Path, str]] = None) -> None:
         """Initialize the repository.
 
@@ -43,19 +205,54 @@ class HabitRepository:
             db_path: Path to the SQLite file. Defaults to ~/.terminal_habit_coach.db.
         """
         self.db_path = Path(db_path or DEFAULT_DB_PATH)
-        # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._ensure_schema()
+        # The file is checked too, in case it was removed since it was set up.
+        provisioned = self.db_path in self._schema_ready and self.db_path.exists()
+        if not provisioned:
+            # Ensure parent directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection serves every call; opening SQLite per query
+        # dominated batch operations such as get_all_stats.
+        self._conn = self._connect()
+        # Bumped on every write so callers can tell when cached reads are stale.
+        self.version = 0
+        if not provisioned:
+            self._ensure_schema()
+            self._schema_ready.add(self.db_path)
 
     def _connect(self) -> sqlite3.Connection:
         """Create a configured database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
         conn.row_factory = sqlite3.Row
+        # These settings are per connection. SQLite ignores the ON DELETE
+        # CASCADE clauses unless asked to enforce foreign keys.
+        conn.executescript(CONNECTION_PRAGMAS)
         return conn
 
+    @property
+    def state_version(self) -> Tuple[int, int]:
+        """Token that changes whenever any connection writes to the database.
+
+        SQLite's ``data_version`` only moves on commits from other connections
+        (another process, say), so it is paired with this repository's own
+        write counter.
+        """
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return data_version, self.version
+
+    def analyze(self) -> None:
+        """Refresh the query planner's table statistics, e.g. after an import."""
+        self._conn.execute("ANALYZE")
+
+    def close(self) -> None:
+        """Refresh query planner statistics and close the connection."""
+        self._conn.execute("PRAGMA optimize")
+        self._conn.close()
+
     def _ensure_schema(self) -> None:
         """Create tables if they don't exist."""
-        with self._connect() as conn:
+        # WAL mode is stored in the database file, so it only needs setting once.
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._conn as conn:
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS habits (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -78,6 +275,14 @@ class HabitRepository:
                     current_streak INTEGER DEFAULT 0,
                     longest_streak INTEGER DEFAULT 0
                 );
+
+                -- Serves recent_logs (newest first) and the per-habit
+                -- COUNT/MAX aggregates without scanning the whole table.
+                CREATE INDEX IF NOT EXISTS idx_log_entries_habit_time
+                    ON log_entries(habit_id, logged_at DESC);
+
+                CREATE INDEX IF NOT EXISTS idx_habits_reminder
+                    ON habits(reminder_time) WHERE reminder_time IS NOT NULL;
                 """)
 
     # ------------------------------------------------------------------
@@ -101,7 +306,7 @@ class HabitRepository:
         Returns:
             Habit: The created habit.
         """
-        with self._connect() as conn:
+        with self._conn as conn:
             cur = conn.execute(
                 "INSERT INTO habits(name, description, frequency, reminder_time) VALUES (?, ?, ?, ?)",
                 (name.strip(), description.strip(), frequency, reminder_time),
@@ -111,6 +316,7 @@ class HabitRepository:
                 "INSERT OR IGNORE INTO streak_metadata(habit_id, current_streak, longest_streak) VALUES (?, 0, 0)",
                 (habit_id,),
             )
+        self.version += 1
         return self.get_habit_by_name(name)
 
     def get_habit_by_name(self, name: str) -> Habit:
@@ -125,19 +331,12 @@ class HabitRepository:
         Raises:
             ValueError: If habit not found.
         """
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM habits WHERE name = ?", (name.strip(),)
-            ).fetchone()
+        row = self._conn.execute(
+            "SELECT * FROM habits WHERE name = ?", (name.strip(),)
+        ).fetchone()
         if not row:
             raise ValueError(f"Habit '{name}' not found")
-        return Habit(
-            id=row["id"],
-            name=row["name"],
-            description=row["description"],
-            frequency=row["frequency"],
-            reminder_time=row["reminder_time"],
-        )
+        return _habit_from_row(row)
 
     def list_habits(self) -> List[Habit]:
         """List all habits ordered by name.
@@ -145,18 +344,8 @@ class HabitRepository:
         Returns:
             List[Habit]: List of habits.
         """
-        with self._connect() as conn:
-            rows = conn.execute("SELECT * FROM habits ORDER BY name").fetchall()
-        return [
-            Habit(
-                id=row["id"],
-                name=row["name"],
-                description=row["description"],
-                frequency=row["frequency"],
-                reminder_time=row["reminder_time"],
-            )
-            for row in rows
-        ]
+        rows = self._conn.execute("SELECT * FROM habits ORDER BY name").fetchall()
+        return [_habit_from_row(row) for row in rows]
 
     def delete_habit(self, name: str) -> None:
         """Delete a habit by name.
@@ -164,8 +353,9 @@ class HabitRepository:
         Args:
             name: Habit name.
         """
-        with self._connect() as conn:
+        with self._conn as conn:
             conn.execute("DELETE FROM habits WHERE name = ?", (name.strip(),))
+        self.version += 1
 
     # ------------------------------------------------------------------
     # Logging operations
@@ -182,58 +372,72 @@ class HabitRepository:
             name: Habit name.
             when: Datetime of the log (default now).
             note: Optional note.
+
+        Raises:
+            ValueError: If habit not found.
         """
-        habit = self.get_habit_by_name(name)
+        name = name.strip()
         when = when or datetime.now()
-        with self._connect() as conn:
-            conn.execute(
-                "INSERT INTO log_entries(habit_id, logged_at, note) VALUES (?, ?, ?)",
-                (habit.id, when.isoformat(), note),
+        # The habit is looked up by the writes themselves, and the log entry
+        # and its streak update commit together.
+        with self._conn as conn:
+            cur = conn.execute(
+                "INSERT INTO log_entries(habit_id, logged_at, note) SELECT id, ?, ? FROM habits WHERE name = ?",
+                (when.isoformat(), note, name),
             )
-        self._update_streaks(habit.id, when.date())
+            if cur.rowcount == 0:
+                raise ValueError(f"Habit '{name}' not found")
+            conn.execute(_STREAK_UPSERT, (when.date().isoformat(), name))
+        self.version += 1
 
-    def _update_streaks(self, habit_id: int, log_date: date) -> None:
-        """Recalculate streaks after a log entry."""
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT last_logged_date, current_streak, longest_streak FROM streak_metadata WHERE habit_id = ?",
-                (habit_id,),
-            ).fetchone()
-
-            if not row:
-                # Should exist if created with add_habit, but handle edge case
-                conn.execute(
-                    "INSERT INTO streak_metadata(habit_id, last_logged_date, current_streak, longest_streak) VALUES (?, ?, 1, 1)",
-                    (habit_id, log_date.isoformat()),
-                )
-                return
-
-            last_logged = row["last_logged_date"]
-            current_streak = row["current_streak"]
-            longest_streak = row["longest_streak"]
-
-            if last_logged:
-                last_date = datetime.fromisoformat(last_logged).date()
-                delta = (log_date - last_date).days
-                if delta == 0:
-                    # already logged today; do not double count streak
-                    return
-                if delta == 1:
-                    # consecutive day
-                    current_streak += 1
-                else:
-                    # broken streak (assuming future dates not allowed or handled elsewhere)
-                    current_streak = 1
-            else:
-                # first log
-                current_streak = 1
-
-            longest_streak = max(longest_streak, current_streak)
+    def log_habits_bulk(
+        self, entries: Iterable[Tuple[str, datetime, Optional[str]]]
+    ) -> int:
+        """Log many occurrences at once, e.g. when importing history.
 
-            conn.execute(
-                "UPDATE streak_metadata SET last_logged_date = ?, current_streak = ?, longest_streak = ? WHERE habit_id = ?",
-                (log_date.isoformat(), current_streak, longest_streak, habit_id),
+        All entries are inserted in one transaction and each affected habit's
+        streaks are then rebuilt once from its full log history, instead of
+        updating them entry by entry.
+
+        Args:
+            entries: ``(habit name, when, note)`` tuples, in any order.
+
+        Returns:
+            int: Number of entries logged.
+
+        Raises:
+            ValueError: If any habit is not found; nothing is logged then.
+        """
+        entries = list(entries)
+        habit_ids = {
+            name: self.get_habit_by_name(name).id for name in {e[0] for e in entries}
+        }
+        # Notes may mix None and str, so only sort on habit and timestamp
+        rows = sorted(
+            ((habit_ids[name], when.isoformat(), note) for name, when, note in entries),
+            key=itemgetter(0, 1),
+        )
+        if not rows:
+            return 0
+
+        ids = sorted(set(habit_ids.values()))
+        with self._conn as conn:
+            conn.executemany(
+                "INSERT INTO log_entries(habit_id, logged_at, note) VALUES (?, ?, ?)",
+                rows,
+            )
+            streaks = conn.execute(
+                _STREAKS_QUERY.format(ids=", ".join("?" * len(ids))), ids
+            ).fetchall()
+            conn.executemany(
+                "INSERT OR REPLACE INTO streak_metadata(habit_id, last_logged_date, current_streak, longest_streak) VALUES (?, ?, ?, ?)",
+                [
+                    (row["habit_id"], row["last_day"], row["current"], row["longest"])
+                    for row in streaks
+                ],
             )
+        self.version += 1
+        return len(rows)
 
     # ------------------------------------------------------------------
     # Queries
@@ -246,37 +450,33 @@ class HabitRepository:
 
         Returns:
             dict: Stats including streaks and counts.
+
+        Raises:
+            ValueError: If habit not found.
         """
-        habit = self.get_habit_by_name(habit_name)
-        with self._connect() as conn:
-            log_row = conn.execute(
-                "SELECT COUNT(*) AS total, MAX(logged_at) AS last_logged FROM log_entries WHERE habit_id = ?",
-                (habit.id,),
-            ).fetchone()
-            streak_row = conn.execute(
-                "SELECT last_logged_date, current_streak, longest_streak FROM streak_metadata WHERE habit_id = ?",
-                (habit.id,),
-            ).fetchone()
-
-        last_logged_date_str = streak_row["last_logged_date"] if streak_row else None
-        if last_logged_date_str:
-            last_logged_date = datetime.fromisoformat(last_logged_date_str).date()
-            days_since = (date.today() - last_logged_date).days
-        else:
-            days_since = None
-
-        return {
-            "habit": habit,
-            "total_logs": log_row["total"] if log_row else 0,
-            "last_logged": log_row["last_logged"],
-            "current_streak": streak_row["current_streak"] if streak_row else 0,
-            "longest_streak": streak_row["longest_streak"] if streak_row else 0,
-            "days_since_log": days_since,
-        }
+        row = self._conn.execute(
+            _HABIT_STATS_QUERY,
+            {"today": date.today().isoformat(), "name": habit_name.strip()},
+        ).fetchone()
+        if not row:
+            raise ValueError(f"Habit '{habit_name}' not found")
+        return _stats_from_row(row)
 
     def get_all_stats(self) -> List[Dict[str, Any]]:
-        """Get stats for all habits."""
-        return [self.get_habit_stats(habit.name) for habit in self.list_habits()]
+        """Get stats for all habits, ordered by name, in a single query."""
+        return [_stats_from_row(row) for row in self.iter_stats_rows()]
+
+    def iter_stats_rows(self) -> Iterator[sqlite3.Row]:
+        """Iterate raw stats rows for all habits, ordered by name.
+
+        Display code reads the columns directly, skipping the ``Habit`` and
+        dict built per row by ``get_all_stats``.
+        """
+        return self._conn.execute(_ALL_STATS_QUERY, {"today": date.today().isoformat()})
+
+    def status_rows(self) -> List[str]:
+        """Get one formatted status table row per habit, ordered by name."""
+        return [row[0] for row in self._conn.execute(_STATUS_ROWS_QUERY)]
 
     def habits_needing_reminder(self, on_date: Optional[date] = None) -> List[Habit]:
         """Find habits with a reminder set that haven't been logged on the given date.
@@ -287,28 +487,29 @@ class HabitRepository:
         Returns:
             List[Habit]: Habits needing attention.
         """
+        return [_habit_from_row(row) for row in self.iter_reminder_rows(on_date)]
+
+    def iter_reminder_rows(
+        self, on_date: Optional[date] = None
+    ) -> Iterator[sqlite3.Row]:
+        """Iterate raw habit rows for ``habits_needing_reminder``.
+
+        Args:
+            on_date: The reference date (default today).
+        """
         on_date = on_date or date.today()
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT h.* FROM habits h
-                LEFT JOIN streak_metadata s ON h.id = s.habit_id
-                WHERE h.reminder_time IS NOT NULL
-                AND (s.last_logged_date IS NULL OR DATE(s.last_logged_date) <> ?)
-                ORDER BY h.name
-                """,
-                (on_date.isoformat(),),
-            ).fetchall()
-        return [
-            Habit(
-                id=row["id"],
-                name=row["name"],
-                description=row["description"],
-                frequency=row["frequency"],
-                reminder_time=row["reminder_time"],
+        return self._conn.execute(
+            """
+            SELECT h.* FROM habits h
+            WHERE h.reminder_time IS NOT NULL
+            AND NOT EXISTS (
+                SELECT 1 FROM streak_metadata s
+                WHERE s.habit_id = h.id AND substr(s.last_logged_date, 1, 10) = ?
             )
-            for row in rows
-        ]
+            ORDER BY h.name
+            """,
+            (on_date.isoformat(),),
+        )
 
     def recent_logs(self, habit_name: str, limit: int = 5) -> Sequence[str]:
         """Get recent log timestamps for a habit.
@@ -321,9 +522,8 @@ class HabitRepository:
             Sequence[str]: List of timestamp strings.
         """
         habit = self.get_habit_by_name(habit_name)
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT logged_at FROM log_entries WHERE habit_id = ? ORDER BY logged_at DESC LIMIT ?",
-                (habit.id, limit),
-            ).fetchall()
+        rows = self._conn.execute(
+            "SELECT logged_at FROM log_entries WHERE habit_id = ? ORDER BY logged_at DESC LIMIT ?",
+            (habit.id, limit),
+        ).fetchall()
         return [row["logged_at"] for row in rows]
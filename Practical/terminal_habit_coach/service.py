@@ -6,15 +6,48 @@ generating reminders.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     from .database import Habit, HabitRepository
 except ImportError:
     from database import Habit, HabitRepository
 
+# Imports of at least this many log entries refresh the planner statistics.
+ANALYZE_AFTER_BULK_LOGS = 1000
+
+# Column layout of the status table. Rows are formatted by the repository's
+# SQL printf with the same widths; this formats the header.
+STATUS_ROW = "{:20} {:>8} {:>8} {:>6} {:>20}".format
+STATUS_HEADER = STATUS_ROW("Habit", "Streak", "Longest", "Total", "Last Logged")
+STATUS_RULE = "-" * len(STATUS_HEADER)
+
+
+def _cached_view(method: Callable[[Any], List[str]]) -> Callable[[Any], List[str]]:
+    """Reuse a rendered view until the repository changes or the day rolls over.
+
+    Views depend on the current date (reminders, "days since"), so the date
+    is part of the cache key alongside the repository's state version, which
+    also catches writes made through other connections.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: TerminalHabitCoach) -> List[str]:
+        key = (self.repo.state_version, date.today())
+        cached = self._views.get(method.__name__)
+        if cached is None or cached[0] != key:
+            cached = self._views[method.__name__] = (key, method(self))
+        return list(cached[1])
+
+    return wrapper
+
+
+REMINDER_LINE = "⏰ {} at {}".format
+STREAK_LINE = "🔥 {}: current {} days, longest {} days, last logged {}.".format
+
 
 @dataclass
 class Reminder:
@@ -30,7 +63,7 @@ class Reminder:
 
     def render(self) -> str:
         """Format the reminder for display."""
-        return f"⏰ {self.habit.name} at {self.reminder_time}"
+        return REMINDER_LINE(self.habit.name, self.reminder_time)
 
 
 class TerminalHabitCoach:
@@ -43,6 +76,7 @@ class TerminalHabitCoach:
             repository: Data persistence layer.
         """
         self.repo = repository or HabitRepository()
+        self._views: Dict[str, Tuple[Tuple[Tuple[int, int], date], List[str]]] = {}
 
     # Habit management -------------------------------------------------
     def add_habit(
@@ -65,71 +99,54 @@ class TerminalHabitCoach:
         """
         return self.repo.add_habit(name, description, frequency, reminder_time)
 
+    @_cached_view
     def list_status(self) -> List[str]:
         """Generate a status report table of all habits.
 
         Returns:
             List[str]: Lines of text representing the status table.
         """
-        lines: List[str] = []
-        stats = self.repo.get_all_stats()
-        if not stats:
+        rows = self.repo.status_rows()
+        if not rows:
             return ["No habits yet. Add one with 'add-habit'."]
-        header = f"{'Habit':20} {'Streak':>8} {'Longest':>8} {'Total':>6} {'Last Logged':>20}"
-        lines.append(header)
-        lines.append("-" * len(header))
-        for stat in stats:
-            habit = stat["habit"]
-            last_logged = stat["last_logged"] or "—"
-            lines.append(
-                f"{habit.name:20} {stat['current_streak']:>8} {stat['longest_streak']:>8} {stat['total_logs']:>6} {last_logged:>20}"
-            )
         reminders = self.render_reminders()
         if reminders:
-            lines.append("")
-            lines.append("Reminders:")
-            lines.extend(reminders)
-        return lines
+            return [STATUS_HEADER, STATUS_RULE, *rows, "", "Reminders:", *reminders]
+        return [STATUS_HEADER, STATUS_RULE, *rows]
 
+    @_cached_view
     def render_streaks(self) -> List[str]:
         """Generate detailed streak information.
 
         Returns:
             List[str]: Lines of text describing streaks.
         """
-        stats = self.repo.get_all_stats()
         lines: List[str] = []
-        if not stats:
-            return ["No streaks to display. Log some habits!"]
-        for stat in stats:
-            habit = stat["habit"]
-            current = stat["current_streak"]
-            longest = stat["longest_streak"]
-            days_since = stat["days_since_log"]
-
-            freshness = "never"
-            if days_since == 0:
-                freshness = "today"
-            elif days_since is not None:
-                freshness = f"{days_since} day(s) ago"
-
+        for row in self.repo.iter_stats_rows():
             lines.append(
-                f"🔥 {habit.name}: current {current} days, longest {longest} days, last logged {freshness}."
+                STREAK_LINE(
+                    row["name"],
+                    row["current_streak"],
+                    row["longest_streak"],
+                    row["freshness"],
+                )
             )
+        if not lines:
+            return ["No streaks to display. Log some habits!"]
         return lines
 
+    @_cached_view
     def render_reminders(self) -> List[str]:
         """Generate reminders for habits due today.
 
         Returns:
             List[str]: Formatted reminder strings.
         """
-        reminders = [
-            Reminder(habit=h, reminder_time=h.reminder_time)  # type: ignore
-            for h in self.repo.habits_needing_reminder()
-            if h.reminder_time
+        return [
+            REMINDER_LINE(row["name"], row["reminder_time"])
+            for row in self.repo.iter_reminder_rows()
+            if row["reminder_time"]
         ]
-        return [reminder.render() for reminder in reminders]
 
     def log(
         self,
@@ -147,6 +164,23 @@ class TerminalHabitCoach:
         when_dt = datetime.fromisoformat(when) if when else None
         self.repo.log_habit(habit_name, when=when_dt, note=note)
 
+    def log_bulk(self, entries: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """Log many completions at once, e.g. when importing history.
+
+        Args:
+            entries: ``(habit name, ISO timestamp, note)`` tuples.
+
+        Returns:
+            int: Number of entries logged.
+        """
+        count = self.repo.log_habits_bulk(
+            (name, datetime.fromisoformat(when), note) for name, when, note in entries
+        )
+        if count >= ANALYZE_AFTER_BULK_LOGS:
+            # A large import shifts the row counts the planner relies on.
+            self.repo.analyze()
+        return count
+
     def habit_summary(self, habit_name: str) -> List[str]:
         """Generate a summary view for a single habit.
 
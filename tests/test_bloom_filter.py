@@ -7,6 +7,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from approximate_set_membership.bloom import (  # noqa: E402
+    BitArray,
     BloomFilter,
     BloomFilterAnalyzer,
 )
@@ -86,3 +87,36 @@ def test_bloom_filter_analyzer():
 
     actual_fpr = analyzer.test_false_positive_rate(bf, inserted, test_items)
     assert 0 <= actual_fpr <= 1.0
+
+
+def test_bit_array_bulk_operations():
+    """Test that batched bit updates agree with single-bit access."""
+    bits = BitArray(20)
+    bits.set(3)
+    bits.set_many([0, 9, 9, 19])
+
+    assert [i for i in range(20) if bits.get(i)] == [0, 3, 9, 19]
+    assert bits.get_many([0, 1, 19]).tolist() == [True, False, True]
+    assert bits.count() == 4
+    assert bits.density() == 0.2
+    assert bits[:4].tolist() == [1, 0, 0, 1]
+
+    bits.clear()
+    assert bits.count() == 0
+
+
+def test_batch_operations_match_single_item_calls():
+    """Test that add_many/contains_many agree with add/contains."""
+    single = BloomFilter(capacity=200, false_positive_rate=0.05)
+    batch = BloomFilter(capacity=200, false_positive_rate=0.05)
+    batch.hash_seed = single.hash_seed
+    items = [f"item_{i}" for i in range(150)]
+
+    for item in items:
+        single.add(item)
+    batch.add_many(items)
+
+    assert batch.bit_array.to_numpy().tolist() == single.bit_array.to_numpy().tolist()
+    assert batch.element_count == single.element_count == 150
+    probes = items[:20] + [f"other_{i}" for i in range(200)]
+    assert batch.contains_many(probes).tolist() == [single.contains(p) for p in probes]
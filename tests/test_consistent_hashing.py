@@ -86,3 +86,9 @@ def test_removing_node_keeps_other_assignments_stable():
             assert after[key] != "c"
         else:
             assert after[key] == before[key]
+
+
+def test_sha256_vnode_batch_matches_single_hashes():
+    hasher = Sha256Hash()
+    assert hasher.hash_vnodes("node", 12) == [hasher(f"node#{v}") for v in range(12)]
+    assert all(value < 2**64 for value in hasher.hash_vnodes("node", 12))
@@ -63,3 +63,76 @@ def test_cli_workflow(tmp_path):
     assert "reading" in out
     out = run_cli(tmp_path, "report")
     assert "Report" in out
+
+
+def test_time_tracker_reads_store_once(tmp_path):
+    store = SessionStore(path=tmp_path / "sessions.json")
+    reads = 0
+    original = store.all_sessions
+
+    def counting_all_sessions():
+        nonlocal reads
+        reads += 1
+        return original()
+
+    store.all_sessions = counting_all_sessions
+    tracker = TimeTracker(store=store)
+    tracker.start_session("coding")
+    assert tracker.get_active_session()["category"] == "coding"
+    tracker.stop_session(notes="done")
+    assert tracker.get_active_session() is None
+    assert tracker.list_sessions()[0]["notes"] == "done"
+    assert len(tracker.report()) == 1
+    assert reads == 1
+    # The cached view matches what was persisted
+    assert TimeTracker(store=SessionStore(store.path)).list_sessions() == (
+        tracker.list_sessions()
+    )
+
+
+def test_active_session_marker(tmp_path):
+    store = SessionStore(path=tmp_path / "sessions.json")
+    tracker = TimeTracker(store=store)
+    session = tracker.start_session("coding")
+    assert store.get_active_id() == session["id"]
+    # A fresh tracker finds the open session through the marker
+    assert TimeTracker(store=store).get_active_session()["id"] == session["id"]
+    tracker.stop_session()
+    assert store.get_active_id() == ""
+
+    # Databases created before the marker fall back to scanning once
+    TimeTracker(store=store).start_session("reading")
+    store.active_path.unlink()
+    active = TimeTracker(store=store).get_active_session()
+    assert active["category"] == "reading"
+    assert store.get_active_id() == active["id"]
+
+
+def test_active_session_marker_is_trusted(tmp_path):
+    store = SessionStore(path=tmp_path / "sessions.json")
+    tracker = TimeTracker(store=store)
+    first = tracker.start_session("coding")
+    tracker.stop_session()
+
+    # An empty marker answers without reading any sessions
+    reads = 0
+    original = store.all_sessions
+
+    def counting_all_sessions():
+        nonlocal reads
+        reads += 1
+        return original()
+
+    store.all_sessions = counting_all_sessions
+    assert TimeTracker(store=store).get_active_session() is None
+    assert reads == 0
+    second = TimeTracker(store=store).start_session("reading")
+    assert reads == 0
+    assert TimeTracker(store=store).get_active_session()["id"] == second["id"]
+    assert reads == 1
+
+    # A marker naming a finished session is cleared instead of reopening it
+    TimeTracker(store=store).stop_session()
+    store.set_active_id(first["id"])
+    assert TimeTracker(store=store).get_active_session() is None
+    assert store.get_active_id() == ""
@@ -1,6 +1,15 @@
 from decimal import Decimal
 
-from Practical.smart_expense_splitter.models import Expense, Participant
+import pytest
+
+from Practical.smart_expense_splitter.models import (
+    VECTORIZE_THRESHOLD,
+    DebtGraph,
+    Expense,
+    Participant,
+    _accumulate_balances,
+)
+from Practical.smart_expense_splitter.parser import load_expenses_from_file
 from Practical.smart_expense_splitter.settlement import (
     build_balance_sheet,
     optimize_settlements,
@@ -33,3 +42,96 @@ def test_optimize_settlements_minimizes_transactions():
     }
     assert payouts[("Bob", "Alice")] == Decimal("45.00")
     assert payouts[("Carla", "Alice")] == Decimal("15.00")
+
+
+def test_optimize_settlements_clears_every_balance():
+    people = [Participant(f"P{index}") for index in range(12)]
+    expenses = [
+        Expense(
+            f"Item {index}",
+            Decimal(17 * index + 13) / Decimal("7"),
+            people[index % len(people)],
+            people[index % 5 : index % 5 + 4],
+        )
+        for index in range(40)
+    ]
+    balances = build_balance_sheet(expenses)
+    plan = optimize_settlements(expenses)
+
+    remaining = dict(balances)
+    for entry in plan.entries:
+        assert entry.amount > 0
+        remaining[entry.payer.name] += entry.amount
+        remaining[entry.receiver.name] -= entry.amount
+    assert sum(balances.values()) == 0
+    assert all(balance == 0 for balance in remaining.values())
+    assert plan.total_transactions() < len(people)
+
+
+def test_expense_split_cents_conserves_amount():
+    people = [Participant(name) for name in ("Alice", "Bob", "Carla")]
+    expense = Expense("Taxi", Decimal("10.00"), people[0], people)
+    assert expense.amount_cents == 1000
+    assert expense.split_cents() == [334, 333, 333]
+
+
+def test_numpy_balance_accumulation_matches_python_loop():
+    pytest.importorskip("numpy")
+    people = [Participant(f"P{index}") for index in range(25)]
+    expenses = [
+        Expense(
+            f"Item {index}",
+            Decimal(37 * index + 101) / Decimal("100"),
+            people[(index * 7) % len(people)],
+            people[index % 9 : index % 9 + 1 + index % 6],
+        )
+        for index in range(VECTORIZE_THRESHOLD + 50)
+    ]
+    vectorized = DebtGraph.from_expenses(expenses)
+    names, values = _accumulate_balances(expenses)
+    assert vectorized.names == names
+    assert vectorized.values == values
+
+
+def test_load_expenses_from_file_streams_rows(tmp_path):
+    ledger = tmp_path / "trip.txt"
+    ledger.write_text(
+        'Groceries "bulk";120.00;Alice;Alice, Bob,Carla\n'
+        "\n"
+        "Museum;60.00; Bob ;Alice,Bob,Carla\r\n",
+        encoding="utf-8",
+    )
+    expenses = load_expenses_from_file(ledger)
+    assert [expense.description for expense in expenses] == [
+        'Groceries "bulk"',
+        "Museum",
+    ]
+    assert expenses[1].payer == Participant("Bob")
+    assert [consumer.name for consumer in expenses[0].consumers] == [
+        "Alice",
+        "Bob",
+        "Carla",
+    ]
+
+
+def test_optimize_settlements_settles_exact_matches_first():
+    alice, bob, carla, dan, erin = (
+        Participant(name) for name in ("Alice", "Bob", "Carla", "Dan", "Erin")
+    )
+    # Alice +9, Bob +6, Carla -6, Dan -5, Erin -4: the greedy pass alone
+    # needs four payments, but Bob/Carla cancel and Dan + Erin cover Alice.
+    expenses = [
+        Expense("Tickets", Decimal("5.00"), alice, [dan]),
+        Expense("Snacks", Decimal("4.00"), alice, [erin]),
+        Expense("Taxi", Decimal("6.00"), bob, [carla]),
+    ]
+    plan = optimize_settlements(expenses)
+    assert plan.total_transactions() == 3
+    payouts = {
+        (entry.payer.name, entry.receiver.name): entry.amount for entry in plan.entries
+    }
+    assert payouts == {
+        ("Carla", "Bob"): Decimal("6.00"),
+        ("Dan", "Alice"): Decimal("5.00"),
+        ("Erin", "Alice"): Decimal("4.00"),
+    }
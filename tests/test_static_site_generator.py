@@ -1,3 +1,4 @@
+import os
 import shutil
 import tempfile
 import unittest
@@ -44,6 +45,65 @@ class TestStaticSiteGenerator(unittest.TestCase):
             self.assertIn("Hello World", content)
             self.assertIn("This is a test", content)
 
+    def test_build_many_pages_in_nested_directories(self):
+        content_dir = self.input_dir / "content"
+        for index in range(12):
+            section = content_dir / f"section{index % 3}"
+            section.mkdir(exist_ok=True)
+            (section / f"page{index}.md").write_text(
+                f"---\ntitle: Page {index}\n---\nBody of page {index}.",
+                encoding="utf-8",
+            )
+
+        generator = SiteGenerator(self.input_dir, self.output_dir)
+        generator.build()
+
+        for index in range(12):
+            page = self.output_dir / f"section{index % 3}" / f"page{index}.html"
+            html = page.read_text(encoding="utf-8")
+            self.assertIn(f"<title>Page {index}</title>", html)
+            self.assertIn(f"Body of page {index}.", html)
+
+    def test_build_copies_static_tree(self):
+        static_dir = self.input_dir / "static"
+        (static_dir / "css").mkdir()
+        (static_dir / "css" / "site.css").write_text("body { margin: 0; }")
+        (static_dir / "empty.txt").write_bytes(b"")
+        blob = bytes(range(256)) * 4096
+        (static_dir / "image.bin").write_bytes(blob)
+
+        SiteGenerator(self.input_dir, self.output_dir).build()
+
+        copied = self.output_dir / "static"
+        self.assertEqual(
+            (copied / "css" / "site.css").read_text(), "body { margin: 0; }"
+        )
+        self.assertEqual((copied / "empty.txt").read_bytes(), b"")
+        self.assertEqual((copied / "image.bin").read_bytes(), blob)
+
+    def test_incremental_build_only_rewrites_changed_pages(self):
+        content_dir = self.input_dir / "content"
+        (content_dir / "other.md").write_text("---\ntitle: Other\n---\nOther.")
+        generator = SiteGenerator(self.input_dir, self.output_dir, incremental=True)
+        generator.build()
+
+        hello = self.output_dir / "hello.html"
+        other = self.output_dir / "other.html"
+        hello.write_text("sentinel")
+        source = content_dir / "other.md"
+        source.write_text("---\ntitle: Other\n---\nUpdated.")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        generator.build()
+
+        self.assertEqual(hello.read_text(), "sentinel")
+        self.assertIn("Updated.", other.read_text(encoding="utf-8"))
+
+        source.unlink()
+        generator.build()
+        self.assertFalse(other.exists())
+        self.assertEqual(hello.read_text(), "sentinel")
+
 
 if __name__ == "__main__":
     unittest.main()
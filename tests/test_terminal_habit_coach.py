@@ -55,3 +55,92 @@ def test_cli_status_output(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
     output = capsys.readouterr().out
     assert "Read" in output
     assert "Reminders" not in output  # already logged today
+
+
+def test_delete_habit_cascades_and_stats_match(tmp_path: Path):
+    repo = HabitRepository(db_path=tmp_path / "habits.db")
+    repo.add_habit("Run")
+    repo.add_habit("Swim")
+    repo.log_habit("Run", when=datetime(2024, 5, 1, 7))
+    repo.log_habit("Run", when=datetime(2024, 5, 2, 7))
+
+    all_stats = repo.get_all_stats()
+    assert [stat["habit"].name for stat in all_stats] == ["Run", "Swim"]
+    assert all_stats[0] == repo.get_habit_stats("Run")
+    assert all_stats[1]["total_logs"] == 0
+    assert all_stats[1]["last_logged"] is None
+
+    repo.delete_habit("Run")
+    conn = repo._conn
+    assert conn.execute("SELECT COUNT(*) FROM log_entries").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM streak_metadata").fetchone()[0] == 1
+    with pytest.raises(ValueError):
+        repo.get_habit_stats("Run")
+    repo.close()
+
+
+def test_bulk_logging_matches_individual_logs(tmp_path: Path):
+    start = datetime(2024, 1, 1, 8)
+    entries = [
+        ("Walk", start + timedelta(days=offset), None)
+        for offset in (0, 1, 2, 5, 6, 6, 7, 20, 21)
+    ]
+    single = HabitRepository(db_path=tmp_path / "single.db")
+    bulk = HabitRepository(db_path=tmp_path / "bulk.db")
+    for repo in (single, bulk):
+        repo.add_habit("Walk")
+    for name, when, note in entries:
+        single.log_habit(name, when=when, note=note)
+
+    assert bulk.log_habits_bulk(reversed(entries)) == len(entries)
+
+    expected = single.get_habit_stats("Walk")
+    actual = bulk.get_habit_stats("Walk")
+    assert actual["current_streak"] == expected["current_streak"] == 2
+    assert actual["longest_streak"] == expected["longest_streak"] == 3
+    assert actual["total_logs"] == expected["total_logs"] == len(entries)
+    coach = TerminalHabitCoach(repository=bulk)
+    assert coach.log_bulk([("Walk", "2024-01-23T08:00:00", "import")]) == 1
+    assert bulk.get_habit_stats("Walk")["current_streak"] == 3
+    with pytest.raises(ValueError):
+        bulk.log_habits_bulk([("Missing", start, None)])
+
+
+def test_bulk_logging_accepts_duplicate_timestamps_with_mixed_notes(tmp_path: Path):
+    repo = HabitRepository(db_path=tmp_path / "habits.db")
+    repo.add_habit("Walk")
+    when = datetime(2024, 1, 1, 8)
+    entries = [("Walk", when, "park"), ("Walk", when, None), ("Walk", when, "")]
+
+    assert repo.log_habits_bulk(entries) == len(entries)
+    assert repo.get_habit_stats("Walk")["total_logs"] == len(entries)
+
+
+def test_status_views_are_cached_until_the_repository_changes(tmp_path: Path):
+    repo = HabitRepository(db_path=tmp_path / "habits.db")
+    coach = TerminalHabitCoach(repository=repo)
+    coach.add_habit("Read", reminder_time="20:00")
+
+    queries = 0
+    original = repo.status_rows
+
+    def counting_status_rows():
+        nonlocal queries
+        queries += 1
+        return original()
+
+    repo.status_rows = counting_status_rows
+    first = coach.list_status()
+    assert coach.list_status() == first
+    assert queries == 1
+    assert "⏰ Read at 20:00" in coach.render_reminders()
+
+    coach.log("Read")
+    assert coach.list_status() != first
+    assert queries == 2
+    assert coach.render_reminders() == []
+
+    # Writes from another connection invalidate the cached views too
+    HabitRepository(db_path=repo.db_path).log_habit("Read")
+    coach.list_status()
+    assert queries == 3
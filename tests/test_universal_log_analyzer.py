@@ -3,7 +3,11 @@ import tempfile
 import unittest
 from unittest.mock import patch
 
-from Practical.universal_log_analyzer.__main__ import analyze_logs, parse_log_line
+from Practical.universal_log_analyzer.__main__ import (
+    analyze_logs,
+    parse_log_file,
+    parse_log_line,
+)
 
 
 class TestLogAnalyzer(unittest.TestCase):
@@ -28,6 +32,29 @@ class TestLogAnalyzer(unittest.TestCase):
         result = parse_log_line(line)
         self.assertEqual(result["size"], 0)
 
+    def test_parse_log_file_matches_line_parser(self):
+        lines = [
+            '127.0.0.1 - - [10/Oct/2000:13:55:36 -0700] "GET /a HTTP/1.0" 200 2326',
+            'junk 127.0.0.1 - - [10/Oct/2000:13:55:36 -0700] "GET /a HTTP/1.0" 200 1',
+            '10.0.0.1 - - [99/Foo/2000:13:55:36 -0700] "GET /b HTTP/1.0" 200 1',
+            '10.0.0.2 - - [11/Oct/2000:01:00:00 -0700] "POST /c HTTP/1.1" 404 -',
+        ]
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as tmp:
+            tmp.write("\n".join(lines) + "\n")
+            tmp_path = tmp.name
+
+        try:
+            df = parse_log_file(tmp_path)
+        finally:
+            os.remove(tmp_path)
+
+        expected = [parse_log_line(line) for line in (lines[0], lines[3])]
+        self.assertEqual(df["path"].tolist(), [row["path"] for row in expected])
+        self.assertEqual(df["size"].tolist(), [row["size"] for row in expected])
+        self.assertEqual(
+            df["timestamp"].tolist(), [row["timestamp"] for row in expected]
+        )
+
     @patch("matplotlib.pyplot.savefig")
     def test_analyze_logs(self, mock_savefig):
         # Create a dummy log file